@@ -0,0 +1,92 @@
+"""Compare records/sec of the stdlib and the fast JSON backends.
+
+Runs the `elements` (bootstrap) and `selections` streams against synthetic
+payloads generated from their schemas, so the numbers only reflect JSON
+decoding, record processing and message encoding, not the network. RECORD
+messages are written to /dev/null.
+
+Usage:
+    poetry run python benchmarks/json_backends.py [--elements 700] [--managers 500]
+        [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import requests
+
+import payloads
+from tap_fpl.codec import FAST_BACKENDS, get_codec
+from tap_fpl.tap import TapFPL
+
+API = "https://fantasy.premierleague.com/api"
+
+
+def make_send(bodies: Dict[str, bytes]) -> Callable[..., requests.Response]:
+    """Return a `Session.send` replacement answering from `bodies` by URL."""
+
+    def send(request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url or ""
+        response.request = request
+        response._content = bodies[response.url.split("?")[0]]
+        return response
+
+    return send
+
+
+def run(config: Dict[str, Any], bodies: Dict[str, bytes]) -> float:
+    """Sync the configured stream and return its records per second."""
+    tap = TapFPL(config=config)
+    send = make_send(bodies)
+    for stream in tap.streams.values():
+        stream.requests_session.send = send  # type: ignore[assignment]
+    stream = tap.streams[config["_stream"]]
+    counted: List[int] = []
+    write_record_message = stream._write_record_message
+
+    def write_and_count(record: dict) -> None:
+        counted.append(1)
+        write_record_message(record)
+
+    stream._write_record_message = write_and_count  # type: ignore[assignment]
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        stream.sync()
+        elapsed = time.perf_counter() - start
+    return len(counted) / elapsed
+
+
+def main() -> None:
+    """Print records/sec per stream and JSON backend."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--elements", type=int, default=700)
+    parser.add_argument("--managers", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    managers = list(range(1, args.managers + 1))
+    bootstrap = payloads.bootstrap(args.elements)
+    bodies = {f"{API}/bootstrap-static": json.dumps(bootstrap).encode()}
+    for manager_id in managers:
+        picks = payloads.picks(manager_id, 1)
+        bodies[f"{API}/entry/{manager_id}/event/1/picks"] = json.dumps(picks).encode()
+
+    base_config = {"managers": managers, "gameweeks": [1], "players": []}
+    backends = ["stdlib"] + [name for name in FAST_BACKENDS if get_codec(name)]
+    print(f"{'stream':<12} {'backend':<8} {'records/s':>12}")
+    for stream_name in ("elements", "selections"):
+        for backend in backends:
+            config = dict(base_config, _stream=stream_name, json_backend=backend)
+            rate = max(run(config, bodies) for _ in range(args.repeat))
+            print(f"{stream_name:<12} {backend:<8} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
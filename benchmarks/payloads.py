@@ -0,0 +1,141 @@
+"""Synthetic FPL API payloads generated from the tap's stream schemas."""
+
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from tap_fpl.streams import SCHEMAS_DIR
+
+STANDINGS_PAGE_SIZE = 50
+
+SEASON_START = datetime(2022, 8, 5, 10)
+
+
+def sample(schema: Dict[str, Any], index: int = 0) -> Any:
+    """Return a value matching `schema`, varied a little by `index`."""
+    types = schema.get("type", "string")
+    if isinstance(types, list):
+        types = next((type_ for type_ in types if type_ != "null"), "null")
+    if types == "object":
+        return {
+            key: sample(value, index)
+            for key, value in schema.get("properties", {}).items()
+        }
+    if types == "array":
+        return [sample(schema.get("items", {}), index + i) for i in range(3)]
+    if types == "integer":
+        return index
+    if types == "number":
+        return index + 0.5
+    if types == "boolean":
+        return bool(index % 2)
+    if schema.get("format") == "date-time":
+        return "2022-08-05T19:00:00Z"
+    return f"value {index}"
+
+
+def load_schema(name: str) -> Dict[str, Any]:
+    """Load a stream schema from the tap package."""
+    with open(SCHEMAS_DIR / name) as schema_file:
+        return json.load(schema_file)
+
+
+def bootstrap(elements: int = 700, gameweeks: int = 38) -> Dict[str, Any]:
+    """Return a `/bootstrap-static` payload with the last gameweek in progress."""
+    events = [sample(load_schema("events.json"), i) for i in range(1, gameweeks + 1)]
+    for event in events:
+        event.update(finished=True, data_checked=True, is_current=False)
+    events[-1].update(finished=False, data_checked=False, is_current=True)
+    return {
+        "events": events,
+        "teams": [sample(load_schema("teams.json"), i) for i in range(1, 21)],
+        "elements": [
+            sample(load_schema("elements.json"), i) for i in range(1, elements + 1)
+        ],
+        "element_types": [
+            sample(load_schema("element_types.json"), i) for i in range(1, 5)
+        ],
+    }
+
+
+def fixtures(count: int = 380) -> list:
+    """Return a `/fixtures` payload."""
+    schema = load_schema("fixtures.json")
+    return [sample(schema, i) for i in range(1, count + 1)]
+
+
+def picks(manager_id: int, gameweek: int) -> Dict[str, Any]:
+    """Return an `/entry/{manager_id}/event/{gameweek}/picks` payload."""
+    payload = sample(load_schema("selection.json"), manager_id)
+    for key in ("manager_id", "gameweek"):
+        payload.pop(key, None)
+    payload["entry_history"]["event"] = gameweek
+    return payload
+
+
+def element_summary(player_id: int) -> Dict[str, Any]:
+    """Return an `/element-summary/{player_id}` payload."""
+    payload = sample(load_schema("player_details.json"), player_id)
+    payload.pop("player_id", None)
+    return payload
+
+
+def standings_page(league_id: int, page: int, league_size: int) -> Dict[str, Any]:
+    """Return one page of `/leagues-classic/{league_id}/standings`."""
+    schema = load_schema("standings.json")
+    first = (page - 1) * STANDINGS_PAGE_SIZE + 1
+    last = min(first + STANDINGS_PAGE_SIZE, league_size + 1)
+    results = []
+    for entry in range(first, last):
+        row = sample(schema, entry)
+        row.pop("league_id", None)
+        row.pop("last_updated_data", None)
+        row.update(entry=entry, rank=entry)
+        results.append(row)
+    return {
+        "last_updated_data": "2022-08-06T18:00:00Z",
+        "league": {"id": league_id, "name": f"League {league_id}"},
+        "standings": {
+            "has_next": last <= league_size,
+            "page": page,
+            "results": results,
+        },
+    }
+
+
+def live(gameweek: int, elements: int = 700) -> Dict[str, Any]:
+    """Return an `/event/{gameweek}/live` payload."""
+    schema = load_schema("live_element_stats.json")
+    live_elements = []
+    for element_id in range(1, elements + 1):
+        stats = sample(schema, element_id + gameweek)
+        for key in ("gameweek", "id"):
+            stats.pop(key, None)
+        explain = stats.pop("explain")
+        live_elements.append({"id": element_id, "stats": stats, "explain": explain})
+    return {"elements": live_elements}
+
+
+def manager_history(gameweeks: int = 38) -> Dict[str, Any]:
+    """Return an `/entry/{manager_id}/history` payload."""
+    schema = load_schema("manager_history.json")
+    current = []
+    for gameweek in range(1, gameweeks + 1):
+        row = sample(schema, gameweek)
+        row.pop("manager_id", None)
+        row["event"] = gameweek
+        current.append(row)
+    return {"current": current, "past": [], "chips": []}
+
+
+def manager_transfers(gameweeks: int = 38) -> list:
+    """Return an `/entry/{manager_id}/transfers` payload, one transfer a gameweek."""
+    schema = load_schema("manager_transfers.json")
+    transfers = []
+    for gameweek in range(gameweeks, 0, -1):
+        row = sample(schema, gameweek)
+        row.pop("manager_id", None)
+        time = SEASON_START + timedelta(weeks=gameweek - 1)
+        row.update(event=gameweek, time=time.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        transfers.append(row)
+    return transfers
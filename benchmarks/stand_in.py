@@ -0,0 +1,190 @@
+"""Local stand-in for the FPL API serving synthetic payloads.
+
+Serves `/bootstrap-static`, `/fixtures`, `/entry/{id}/event/{gw}/picks`,
+`/element-summary/{id}`, `/leagues-classic/{id}/standings`, `/event/{gw}/live`,
+`/entry/{id}/history` and `/entry/{id}/transfers` over HTTP/1.1 with keep-alive,
+optionally delaying every response to mimic network latency.
+
+Usage:
+    poetry run python benchmarks/stand_in.py [--port 8000] [--latency 0.05]
+
+then point the tap at it with `"api_url": "http://127.0.0.1:8000/api"`.
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Match, Optional, Pattern, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import payloads
+
+Route = Callable[[Match, Dict[str, list]], bytes]
+
+
+def encode(payload: object) -> bytes:
+    """Encode a payload as the API does."""
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+class FPLStandIn:
+    """Threaded HTTP server answering FPL API paths under `/api`."""
+
+    def __init__(
+        self,
+        elements: int = 700,
+        fixtures: int = 380,
+        gameweeks: int = 38,
+        league_size: int = 1000,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """Build the static payloads and bind the server."""
+        self.latency = latency
+        self.elements = elements
+        self.league_size = league_size
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self._bootstrap = encode(payloads.bootstrap(elements, gameweeks))
+        self._fixtures = encode(payloads.fixtures(fixtures))
+        # History and transfers are the same for every manager
+        self._manager_history = encode(payloads.manager_history(gameweeks))
+        self._manager_transfers = encode(payloads.manager_transfers(gameweeks))
+        self._routes: Tuple[Tuple[Pattern, Route], ...] = (
+            (re.compile(r"/api/bootstrap-static/?$"), lambda *_: self._bootstrap),
+            (re.compile(r"/api/fixtures/?$"), lambda *_: self._fixtures),
+            (re.compile(r"/api/entry/(\d+)/event/(\d+)/picks/?$"), self._picks),
+            (re.compile(r"/api/element-summary/(\d+)/?$"), self._element_summary),
+            (re.compile(r"/api/leagues-classic/(\d+)/standings/?$"), self._standings),
+            (re.compile(r"/api/event/(\d+)/live/?$"), self._live),
+            (
+                re.compile(r"/api/entry/(\d+)/history/?$"),
+                lambda *_: self._manager_history,
+            ),
+            (
+                re.compile(r"/api/entry/(\d+)/transfers/?$"),
+                lambda *_: self._manager_transfers,
+            ),
+        )
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Return the base URL to configure as the tap's `api_url`."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def reset_counters(self) -> None:
+        """Zero the request and byte counters."""
+        with self._lock:
+            self.requests = 0
+            self.bytes_sent = 0
+
+    def start(self) -> None:
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _picks_body(gameweek: int) -> bytes:
+        # Picks only vary by gameweek, so thousands of managers share 38 bodies
+        return encode(payloads.picks(1, gameweek))
+
+    def _picks(self, match: Match, query: Dict[str, list]) -> bytes:
+        return self._picks_body(int(match.group(2)))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _element_summary_body(player_id: int) -> bytes:
+        return encode(payloads.element_summary(player_id))
+
+    def _element_summary(self, match: Match, query: Dict[str, list]) -> bytes:
+        return self._element_summary_body(int(match.group(1)))
+
+    def _standings(self, match: Match, query: Dict[str, list]) -> bytes:
+        page = int(query.get("page_standings", ["1"])[0])
+        return encode(
+            payloads.standings_page(int(match.group(1)), page, self.league_size)
+        )
+
+    @lru_cache(maxsize=None)
+    def _live_body(self, gameweek: int) -> bytes:
+        return encode(payloads.live(gameweek, self.elements))
+
+    def _live(self, match: Match, query: Dict[str, list]) -> bytes:
+        return self._live_body(int(match.group(1)))
+
+    def respond(self, url: str) -> Optional[bytes]:
+        """Return the body served for `url`, or None if it is not an API path."""
+        parts = urlsplit(url)
+        for pattern, route in self._routes:
+            match = pattern.match(parts.path)
+            if match:
+                return route(match, parse_qs(parts.query))
+        return None
+
+    def _handler(self) -> type:
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802
+                if stand_in.latency:
+                    time.sleep(stand_in.latency)
+                body = stand_in.respond(self.path)
+                status = 200 if body is not None else 404
+                body = body if body is not None else b'"The game is being updated."'
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with stand_in._lock:
+                    stand_in.requests += 1
+                    stand_in.bytes_sent += len(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    """Serve the stand-in until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--league-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    stand_in = FPLStandIn(
+        league_size=args.league_size,
+        latency=args.latency,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving the FPL API stand-in at {stand_in.url}")
+    try:
+        stand_in.server.serve_forever()
+    except KeyboardInterrupt:
+        stand_in.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""End-to-end benchmark of every stream against the local FPL API stand-in.
+
+Each stream is synced by a separate `tap-fpl` process pointed at an in-process
+`FPLStandIn`, so the reported peak RSS is that of the stream alone. For each
+stream the suite reports wall time, requests/sec, records/sec and peak RSS.
+
+Usage:
+    poetry run python benchmarks/suite.py [--managers 1000] [--latency 0.02]
+        [--max-concurrency 8] [--streams selections fixtures] [--output out.json]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from stand_in import FPLStandIn
+
+DEFAULT_STREAMS = [
+    "events",
+    "teams",
+    "elements",
+    "element-types",
+    "fixtures",
+    "standings",
+    "player-details",
+    "selections",
+    "live-element-stats",
+    "manager-history",
+    "manager-transfers",
+]
+
+TAP_COMMAND = [sys.executable, "-c", "from tap_fpl.tap import TapFPL; TapFPL.cli()"]
+
+RECORD_PREFIXES = (b'{"type": "RECORD"', b'{"type":"RECORD"')
+
+
+def peak_rss_mib(max_rss: int) -> float:
+    """Convert `ru_maxrss` to MiB; it is in bytes on macOS and KiB elsewhere."""
+    return max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_stream(
+    stand_in: FPLStandIn, stream: str, config: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Sync one stream in a tap subprocess and return its measurements."""
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as config_file:
+        json.dump(dict(config, _stream=stream), config_file)
+    stand_in.reset_counters()
+    records = 0
+    try:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            TAP_COMMAND + ["--config", config_file.name],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        assert process.stdout
+        for line in process.stdout:
+            if line.startswith(RECORD_PREFIXES):
+                records += 1
+        _, status, rusage = os.wait4(process.pid, 0)
+        wall_time = time.perf_counter() - start
+        process.returncode = os.WEXITSTATUS(status)
+    finally:
+        os.unlink(config_file.name)
+    return {
+        "stream": stream,
+        "exit_code": process.returncode,
+        "wall_time": wall_time,
+        "requests": stand_in.requests,
+        "bytes": stand_in.bytes_sent,
+        "records": records,
+        "requests_per_second": stand_in.requests / wall_time,
+        "records_per_second": records / wall_time,
+        "peak_rss_mib": peak_rss_mib(rusage.ru_maxrss),
+    }
+
+
+def main() -> None:
+    """Run the suite and print one row per stream."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--streams", nargs="+", default=DEFAULT_STREAMS)
+    parser.add_argument("--managers", type=int, default=1000)
+    parser.add_argument("--gameweeks", type=int, default=38)
+    parser.add_argument("--elements", type=int, default=700)
+    parser.add_argument("--fixtures", type=int, default=380)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--max-concurrency", type=int, default=1)
+    parser.add_argument(
+        "--config", default="{}", help="extra tap settings as a JSON object"
+    )
+    parser.add_argument("--output", help="also write the results to a JSON file")
+    args = parser.parse_args()
+
+    stand_in = FPLStandIn(
+        elements=args.elements,
+        fixtures=args.fixtures,
+        gameweeks=args.gameweeks,
+        league_size=args.managers,
+        latency=args.latency,
+    )
+    stand_in.start()
+    config = {
+        "api_url": stand_in.url,
+        "managers": list(range(1, args.managers + 1)),
+        "gameweeks": list(range(1, args.gameweeks + 1)),
+        "players": list(range(1, args.elements + 1)),
+        "league_id": 1,
+        "max_concurrency": args.max_concurrency,
+        **json.loads(args.config),
+    }
+
+    results: List[Dict[str, Any]] = []
+    print(
+        f"{'stream':<16} {'wall s':>8} {'requests':>9} {'req/s':>9} "
+        f"{'records':>9} {'rec/s':>9} {'RSS MiB':>8}"
+    )
+    try:
+        for stream in args.streams:
+            result = run_stream(stand_in, stream, config)
+            results.append(result)
+            failed = " (failed)" if result["exit_code"] else ""
+            print(
+                f"{stream:<16} {result['wall_time']:>8.2f} {result['requests']:>9} "
+                f"{result['requests_per_second']:>9.1f} {result['records']:>9} "
+                f"{result['records_per_second']:>9.1f} "
+                f"{result['peak_rss_mib']:>8.1f}{failed}",
+                flush=True,
+            )
+    finally:
+        stand_in.stop()
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Optional asyncio request engine for the fan-out streams, built on aiohttp."""
+
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, cast
+
+import requests
+from singer_sdk.exceptions import RetriableAPIError
+
+from tap_fpl.client import FPLStream, build_response, response_size
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:
+    aiohttp = None  # type: ignore[assignment]
+
+#: Attempts per request, as with the SDK's default request decorator.
+MAX_TRIES = 5
+
+
+class AsyncRequestEngine:
+    """Event loop on a background thread sending requests with aiohttp.
+
+    Each request is a coroutine rather than an OS thread, so thousands can be in
+    flight at once over a bounded pool of connections. Requests are handed over
+    from the synchronous streams with `submit`, which returns a
+    `concurrent.futures.Future`; `FPLStream.request_many` bounds how many are
+    submitted ahead of the Singer emitter, providing backpressure.
+
+    Requests wait for the tap's rate limiter, use its response cache, are
+    validated by the stream and retried like the SDK's synchronous requests.
+    """
+
+    def __init__(self, connection_limit: int, timeout: float) -> None:
+        """Start the event loop and open the aiohttp session.
+
+        Args:
+            connection_limit: Most connections open at once.
+            timeout: Total timeout of a request, in seconds.
+
+        Raises:
+            ImportError: If aiohttp is not installed.
+        """
+        if aiohttp is None:
+            raise ImportError("The asyncio request engine requires aiohttp.")
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="tap-fpl-asyncio", daemon=True
+        )
+        self._thread.start()
+        self._session = asyncio.run_coroutine_threadsafe(
+            self._open_session(connection_limit, timeout), self._loop
+        ).result()
+
+    async def _open_session(self, connection_limit: int, timeout: float) -> Any:
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=connection_limit),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        )
+
+    def submit(
+        self, stream: FPLStream, prepared_request: requests.PreparedRequest
+    ) -> Future:
+        """Schedule a request for a stream on the event loop.
+
+        Args:
+            stream: The stream sending the request.
+            prepared_request: The request to send.
+
+        Returns:
+            A future resolving to the validated response.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self._request(stream, prepared_request), self._loop
+        )
+
+    async def _request(
+        self, stream: FPLStream, prepared_request: requests.PreparedRequest
+    ) -> requests.Response:
+        url = cast(str, prepared_request.url)
+        endpoint = stream.get_endpoint(url)
+        rate_limiter = stream._tap.rate_limiter  # type: ignore[attr-defined]
+        attempt = 0
+        while True:
+            attempt += 1
+            if rate_limiter:
+                delay = rate_limiter.reserve()
+                if delay:
+                    await asyncio.sleep(delay)
+            cached_response = stream.apply_cached_validators(prepared_request)
+            start = time.perf_counter()
+            try:
+                response = await self._send(prepared_request)
+                stream.validate_response(response)
+            except (RetriableAPIError, asyncio.TimeoutError):
+                stream.metrics.observe_retry(stream.name, endpoint)
+                if attempt == MAX_TRIES:
+                    raise
+                # Exponential backoff with full jitter, as backoff.expo(factor=2)
+                await asyncio.sleep(random.uniform(0, 2 ** attempt))
+                continue
+            stream.update_response_cache(url, response, cached_response)
+            stream.archive_response(url, response)
+            stream.metrics.observe_request(
+                stream.name,
+                endpoint,
+                time.perf_counter() - start,
+                response_size(response),
+            )
+            return response
+
+    async def _send(
+        self, prepared_request: requests.PreparedRequest
+    ) -> requests.Response:
+        start = time.perf_counter()
+        async with self._session.request(
+            prepared_request.method,
+            URL(cast(str, prepared_request.url), encoded=True),
+            headers=dict(prepared_request.headers),
+            data=prepared_request.body,
+        ) as response:
+            body = await response.read()
+        return build_response(
+            prepared_request,
+            response.status,
+            response.reason,
+            response.headers,
+            body,
+            time.perf_counter() - start,
+        )
+
+    def close(self) -> None:
+        """Close the aiohttp session and stop the event loop."""
+        asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,109 @@
+"""Append-only archive of raw API responses, for recording and offline replay."""
+
+import gzip
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Dict, NamedTuple, Optional, Tuple
+
+#: Suffix of the offset index written next to an archive.
+INDEX_SUFFIX = ".index.jsonl"
+
+
+class ArchivedResponse(NamedTuple):
+    """A response as it was received, with the time it was fetched."""
+
+    url: str
+    fetched_at: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class ResponseArchive:
+    """Gzip-framed archive of response bodies keyed by URL and fetch time.
+
+    Every response is appended to the archive as its own gzip member, holding a
+    JSON header line (URL, fetch time, status and headers) followed by the raw
+    body, so the whole archive can still be read with `zcat`. Each member's
+    offset and length are appended to a JSON Lines index next to the archive,
+    which lets a replay seek straight to the latest response for a URL.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open the archive at `path` and load its index, if it exists."""
+        self.path = path
+        self.index_path = path + INDEX_SUFFIX
+        self._offsets: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as index_file:
+                for line in index_file:
+                    entry = json.loads(line)
+                    self._offsets[entry["url"]] = (entry["offset"], entry["length"])
+        self._archive = open(path, "ab+")
+        self._index = open(self.index_path, "a")
+
+    def __contains__(self, url: str) -> bool:
+        """Return True if a response for `url` was archived."""
+        return url in self._offsets
+
+    def append(
+        self, url: str, status: int, headers: Dict[str, str], body: bytes
+    ) -> None:
+        """Archive a response received now.
+
+        Args:
+            url: The request URL.
+            status: HTTP status code.
+            headers: Response headers.
+            body: Raw response body.
+        """
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        header = json.dumps(
+            {"url": url, "fetched_at": fetched_at, "status": status, "headers": headers}
+        )
+        member = gzip.compress(header.encode() + b"\n" + body, mtime=0)
+        with self._lock:
+            self._archive.seek(0, os.SEEK_END)
+            offset = self._archive.tell()
+            self._archive.write(member)
+            self._archive.flush()
+            self._index.write(
+                json.dumps(
+                    {
+                        "url": url,
+                        "fetched_at": fetched_at,
+                        "offset": offset,
+                        "length": len(member),
+                    }
+                )
+                + "\n"
+            )
+            self._index.flush()
+            self._offsets[url] = (offset, len(member))
+
+    def get(self, url: str) -> Optional[ArchivedResponse]:
+        """Return the latest archived response for `url`, if any."""
+        with self._lock:
+            if url not in self._offsets:
+                return None
+            offset, length = self._offsets[url]
+            self._archive.seek(offset)
+            member = self._archive.read(length)
+        header, body = gzip.decompress(member).split(b"\n", 1)
+        fields = json.loads(header)
+        return ArchivedResponse(
+            fields["url"],
+            fields["fetched_at"],
+            fields["status"],
+            fields["headers"],
+            body,
+        )
+
+    def close(self) -> None:
+        """Close the archive and its index."""
+        with self._lock:
+            self._archive.close()
+            self._index.close()
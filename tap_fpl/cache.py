@@ -0,0 +1,118 @@
+"""Persistent HTTP response cache used for conditional requests."""
+
+import sqlite3
+import threading
+import time
+from typing import NamedTuple, Optional
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+#: Writes grouped into a single transaction before it is committed.
+COMMIT_EVERY = 500
+
+
+class CachedResponse(NamedTuple):
+    """A cached response body and the validators it was served with."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+
+
+class ResponseCache:
+    """On-disk store of response bodies keyed by URL, evicted least recently used.
+
+    Bodies are stored with their `ETag` and `Last-Modified` validators so that a
+    later request can be made conditional and a `304 Not Modified` answer can be
+    replayed from disk. Once the stored bodies exceed `max_bytes`, the least
+    recently used entries are dropped.
+
+    The total size of the stored bodies is kept in memory, so storing a body
+    does not scan the table, and writes are committed `COMMIT_EVERY` at a time
+    and on `close`.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Open (or create) the cache database at `path`."""
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " url TEXT PRIMARY KEY,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " body BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)"
+        )
+        (self._total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        self._connection.commit()
+        self._pending_writes = 0
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for `url`, if any."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT etag, last_modified, body FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def touch(self, url: str) -> None:
+        """Mark the response for `url` as recently used."""
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET last_used = ? WHERE url = ?", (time.time(), url)
+            )
+            self._written()
+
+    def put(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body: bytes,
+    ) -> None:
+        """Store a response body with its validators and evict if over budget."""
+        with self._lock:
+            previous = self._connection.execute(
+                "SELECT size FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body, len(body), time.time()),
+            )
+            self._total += len(body) - (previous[0] if previous else 0)
+            if self._total > self.max_bytes:
+                self._evict()
+            self._written()
+
+    def _evict(self) -> None:
+        rows = self._connection.execute(
+            "SELECT url, size FROM responses ORDER BY last_used"
+        )
+        evicted = []
+        for url, size in rows:
+            if self._total <= self.max_bytes:
+                break
+            evicted.append((url,))
+            self._total -= size
+        self._connection.executemany("DELETE FROM responses WHERE url = ?", evicted)
+
+    def _written(self) -> None:
+        self._pending_writes += 1
+        if self._pending_writes >= COMMIT_EVERY:
+            self._connection.commit()
+            self._pending_writes = 0
+
+    def close(self) -> None:
+        """Commit pending writes and close the underlying database."""
+        with self._lock:
+            self._connection.commit()
+            self._connection.close()
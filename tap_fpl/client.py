@@ -1,28 +1,935 @@
 """REST client handling, including FPLStream base class."""
 
+import hashlib
+import json
+import socket
+import sys
+import time
+import zlib
 import requests
+import singer
+from collections import deque
+from datetime import timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, List, Iterable
+from typing import (
+    Any, Callable, Deque, Dict, Generator, Mapping, Optional, Union, List, Iterable,
+    Iterator, Tuple, cast
+)
 
-from memoization import cached
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection
 
+from singer import RecordMessage
+from singer_sdk.exceptions import FatalAPIError, RetriableAPIError
+from singer_sdk.helpers._util import utc_now
 from singer_sdk.helpers.jsonpath import extract_jsonpath
 from singer_sdk.streams import RESTStream
 
+from tap_fpl.cache import CachedResponse
+from tap_fpl.conform import RecordConformer
+
+from tap_fpl.jsonstream import CHUNK_SIZE, iter_array_items, iter_object_members
+from tap_fpl.metrics import MetricsRegistry, endpoint_template
+from tap_fpl.ratelimit import parse_retry_after
+
 
 SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
 
+BOOTSTRAP_PATH = "/bootstrap-static"
+
+DEFAULT_API_URL = "https://fantasy.premierleague.com/api"
+
+#: Endpoints whose bodies are decoded incrementally with `stream_responses`. Only
+#: these are sent with `stream=True`, so that fan-out responses waiting to be
+#: parsed never hold on to a pooled connection.
+STREAMED_ENDPOINTS = frozenset(
+    [
+        BOOTSTRAP_PATH,
+        "/fixtures",
+        "/leagues-classic/{id}/standings",
+        "/event/{id}/live",
+    ]
+)
+
+
+def record_fingerprint(record: dict, keys: Optional[List[str]] = None) -> str:
+    """Return a compact, stable fingerprint of a record or of some of its keys.
+
+    Args:
+        record: Record to fingerprint.
+        keys: Keys to restrict the fingerprint to. All keys are used if omitted.
+
+    Returns:
+        A 16 character hex digest.
+    """
+    values = record if keys is None else {key: record.get(key) for key in keys}
+    serialized = json.dumps(values, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(serialized, digest_size=8).hexdigest()
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter whose pooled connections send TCP keep-alive probes.
+
+    Probes stop idle pooled connections from being silently dropped by
+    middleboxes between bursts of requests, which would otherwise cost a new
+    TCP and TLS handshake.
+    """
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool manager with `SO_KEEPALIVE` set on new sockets."""
+        kwargs.setdefault(
+            "socket_options",
+            HTTPConnection.default_socket_options
+            + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+        )
+        super().init_poolmanager(*args, **kwargs)
+
+
+def connection_stats(session: requests.Session) -> Tuple[int, int]:
+    """Return the connections opened and requests sent by a session's pools.
+
+    Args:
+        session: The session to inspect.
+
+    Returns:
+        A `(connections_opened, requests)` tuple summed over every host pool.
+    """
+    connections_opened = requests_sent = 0
+    for adapter in session.adapters.values():
+        pools = adapter.poolmanager.pools  # type: ignore[attr-defined]
+        for key in pools.keys():
+            pool = pools[key]
+            connections_opened += pool.num_connections
+            requests_sent += pool.num_requests
+    return connections_opened, requests_sent
+
+
+def checkpoint_key(key: Any) -> Any:
+    """Return a request key as it is stored in a state checkpoint."""
+    return list(key) if isinstance(key, tuple) else key
+
+
+def shard_of(key: Any, shard_count: int) -> int:
+    """Return the shard a work key belongs to.
+
+    CRC32 of the key's text is the same in every process and on every machine,
+    unlike Python's salted `hash`.
+    """
+    return zlib.crc32(str(key).encode()) % shard_count
+
+
+def build_response(
+    prepared_request: requests.PreparedRequest,
+    status: int,
+    reason: Optional[str],
+    headers: Mapping[str, str],
+    body: bytes,
+    elapsed: float,
+) -> requests.Response:
+    """Return a `requests.Response` for a response received by another client.
+
+    Args:
+        prepared_request: The request that was sent.
+        status: HTTP status code.
+        reason: HTTP reason phrase.
+        headers: Response headers.
+        body: The whole (decompressed) response body.
+        elapsed: Seconds between sending the request and reading the body.
+
+    Returns:
+        A response the streams can validate and parse as if `requests` sent it.
+    """
+    response = requests.Response()
+    response.status_code = status
+    response.reason = reason or ""
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = body
+    response._content_consumed = True  # type: ignore[attr-defined]
+    response.url = prepared_request.url or ""
+    response.request = prepared_request
+    response.elapsed = timedelta(seconds=elapsed)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+def response_size(response: requests.Response) -> int:
+    """Return the body size of a response without reading a streamed body."""
+    content_length = response.headers.get("Content-Length")
+    if isinstance(content_length, str) and content_length.isdigit():
+        return int(content_length)
+    content = getattr(response, "_content", None)
+    return len(content) if isinstance(content, bytes) else 0
+
 
 class FPLStream(RESTStream):
     """FPL stream class."""
 
-    url_base = "https://fantasy.premierleague.com/api"
+    @property
+    def url_base(self) -> str:
+        """Return the API base URL, which `api_url` may point at a stand-in."""
+        return self.config.get("api_url", DEFAULT_API_URL)
 
     records_jsonpath = "$[*]"  
 
+    # Whether `cdc_mode` applies to the stream, whose records are keyed by `id`
+    supports_cdc = False
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the stream on the session shared by every stream of the tap.
+
+        The first stream's session becomes the tap's, with its connection pool to
+        the FPL host sized for the configured concurrency, and later streams
+        adopt it so that every request reuses the same pooled connections.
+        """
+        super().__init__(*args, **kwargs)
+        tap_session = self._tap.requests_session  # type: ignore[attr-defined]
+        if tap_session is None:
+            self.requests_session.mount(
+                self.url_base, KeepAliveAdapter(pool_maxsize=self.http_pool_maxsize)
+            )
+            self._tap.requests_session = self.requests_session  # type: ignore
+        else:
+            self._requests_session = tap_session
+        self._record_conformer: Optional[RecordConformer] = None
+        self._checkpoint_position = 0
+        self._checkpoint_time = time.monotonic()
 
     def parse_response(self, response: requests.Response) -> Iterable[dict]:
         """Parse the response and return an iterator of result rows."""
         # TODO: Parse response body and return a set of records.
-        yield from extract_jsonpath(self.records_jsonpath, input=response.json())
+        yield from extract_jsonpath(
+            self.records_jsonpath, input=self.decode_json(response)
+        )
+
+    def _request(
+        self, prepared_request: requests.PreparedRequest, context: Optional[dict]
+    ) -> requests.Response:
+        """Send a request, recording its latency and size in the tap's metrics.
+
+        Requests first wait for the tap's rate limiter, if one is configured.
+        Attempts failing with an error the request decorator retries are
+        counted as retries of their endpoint. With a response archive, responses
+        are recorded to it or, in replay mode, read from it without any request.
+
+        Args:
+            prepared_request: The request to send.
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The response.
+        """
+        replaying = self.archive_mode == "replay"
+        rate_limiter = self._tap.rate_limiter  # type: ignore[attr-defined]
+        if rate_limiter and not replaying:
+            rate_limiter.acquire()
+
+        endpoint = self.get_endpoint(prepared_request.url)
+        start = time.perf_counter()
+        try:
+            if replaying:
+                response = self.replay_response(prepared_request)
+            else:
+                response = self._conditional_request(prepared_request, context)
+                self.archive_response(cast(str, prepared_request.url), response)
+        except (RetriableAPIError, requests.exceptions.ReadTimeout):
+            self.metrics.observe_retry(self.name, endpoint)
+            raise
+        self.metrics.observe_request(
+            self.name, endpoint, time.perf_counter() - start, response_size(response)
+        )
+        return response
+
+    def _conditional_request(
+        self, prepared_request: requests.PreparedRequest, context: Optional[dict]
+    ) -> requests.Response:
+        """Send a request, made conditional when a cached response exists.
+
+        When the tap has a response cache, the validators of the cached response
+        are sent as `If-None-Match`/`If-Modified-Since` and a `304 Not Modified`
+        answer is replayed as a `200` carrying the cached body. Only requests to
+        the `STREAMED_ENDPOINTS` are sent with `stream=True`, see `is_streamed`.
+
+        Args:
+            prepared_request: The request to send.
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The (possibly replayed) response.
+        """
+        cached_response = self.apply_cached_validators(prepared_request)
+        response = self.requests_session.send(
+            prepared_request,
+            timeout=self.timeout,
+            stream=self.is_streamed(prepared_request.url),
+        )
+        if self._LOG_REQUEST_METRICS:
+            extra_tags = {}
+            if self._LOG_REQUEST_METRIC_URLS:
+                extra_tags["url"] = prepared_request.path_url
+            self._write_request_duration_log(
+                endpoint=self.path,
+                response=response,
+                context=context,
+                extra_tags=extra_tags,
+            )
+        self.validate_response(response)
+        self.update_response_cache(
+            cast(str, prepared_request.url), response, cached_response
+        )
+        return response
+
+    def apply_cached_validators(
+        self, prepared_request: requests.PreparedRequest
+    ) -> Optional[CachedResponse]:
+        """Make a request conditional on the cached response for its URL.
+
+        Args:
+            prepared_request: The request to send.
+
+        Returns:
+            The cached response, if the tap has a response cache holding one.
+        """
+        response_cache = self._tap.response_cache  # type: ignore[attr-defined]
+        if response_cache is None:
+            return None
+        cached_response = response_cache.get(prepared_request.url)
+        if cached_response:
+            if cached_response.etag:
+                prepared_request.headers["If-None-Match"] = cached_response.etag
+            if cached_response.last_modified:
+                prepared_request.headers["If-Modified-Since"] = (
+                    cached_response.last_modified
+                )
+        return cached_response
+
+    def update_response_cache(
+        self,
+        url: str,
+        response: requests.Response,
+        cached_response: Optional[CachedResponse],
+    ) -> None:
+        """Replay the cached body of a `304`, or cache the body of a new `200`.
+
+        Args:
+            url: The request URL.
+            response: The response to a request made by `apply_cached_validators`.
+            cached_response: The cached response the request was made
+                conditional on.
+        """
+        response_cache = self._tap.response_cache  # type: ignore[attr-defined]
+        if response_cache is None:
+            return
+        if cached_response and response.status_code == 304:
+            response.status_code = 200
+            response._content = cached_response.body
+            response._content_consumed = True  # type: ignore[attr-defined]
+            response_cache.touch(url)
+        elif response.status_code == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                response_cache.put(url, etag, last_modified, response.content)
+
+    @property
+    def archive_mode(self) -> Optional[str]:
+        """Return "record" or "replay" if the tap has a response archive."""
+        if self._tap.response_archive is None:  # type: ignore[attr-defined]
+            return None
+        return self.config.get("archive_mode", "record")
+
+    def archive_response(self, url: str, response: requests.Response) -> None:
+        """Append a successful response to the tap's archive when recording.
+
+        Args:
+            url: The request URL.
+            response: The response received for it.
+        """
+        if self.archive_mode == "record":
+            self._tap.response_archive.append(  # type: ignore[attr-defined]
+                url, response.status_code, dict(response.headers), response.content
+            )
+
+    def replay_response(
+        self, prepared_request: requests.PreparedRequest
+    ) -> requests.Response:
+        """Return the archived response to a request instead of sending it.
+
+        Args:
+            prepared_request: The request to replay.
+
+        Returns:
+            The validated response, as it was recorded.
+
+        Raises:
+            FatalAPIError: If the archive has no response for the request URL.
+        """
+        archived = self._tap.response_archive.get(  # type: ignore[attr-defined]
+            prepared_request.url
+        )
+        if archived is None:
+            raise FatalAPIError(
+                f"No archived response for {prepared_request.url} to replay."
+            )
+        response = build_response(
+            prepared_request,
+            archived.status,
+            None,
+            archived.headers,
+            archived.body,
+            0.0,
+        )
+        self.validate_response(response)
+        return response
+
+    def validate_response(self, response: requests.Response) -> None:
+        """Validate a response, treating `429 Too Many Requests` as retriable.
+
+        A 429 also throttles the tap's rate limiter, honouring `Retry-After`,
+        while successful responses let it recover towards the configured rate.
+
+        Args:
+            response: A `requests.Response` object.
+
+        Raises:
+            RetriableAPIError: If the API asked the tap to slow down.
+        """
+        rate_limiter = self._tap.rate_limiter  # type: ignore[attr-defined]
+        if response.status_code == 429:
+            if rate_limiter:
+                rate_limiter.throttle(
+                    parse_retry_after(response.headers.get("Retry-After"))
+                )
+            raise RetriableAPIError(
+                f"429 Too Many Requests for path: {self.path}"
+            )
+        super().validate_response(response)
+        if rate_limiter:
+            rate_limiter.recover()
+
+    def get_records(self, context: Optional[dict]) -> Iterable[Dict[str, Any]]:
+        """Return a generator of records.
+
+        In `cdc_mode`, only records changed since the previous run are returned.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Yields:
+            One item per (possibly processed) record in the API.
+        """
+        records = super().get_records(context)
+        if self.supports_cdc and self.config.get("cdc_mode"):
+            records = self.iter_changed_records(records)
+        yield from records
+
+    def finalize_state_progress_markers(self, state: Optional[dict] = None) -> None:
+        """Finalize progress markers, finishing the run after the last stream.
+
+        `Tap.sync_all` finalizes each stream it syncs directly once it is done,
+        so the tap's `finish_sync` is called from here after the last one.
+
+        Args:
+            state: State object to promote progress markers with.
+        """
+        super().finalize_state_progress_markers(state)
+        if (
+            state is None
+            and not self.parent_stream_type
+            and self._tap.is_last_synced_stream(self)  # type: ignore[attr-defined]
+        ):
+            self._tap.finish_sync()  # type: ignore[attr-defined]
+
+    def iter_changed_records(
+        self, records: Iterable[Dict[str, Any]]
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the records that are new or changed since the previous run.
+
+        The fingerprint of every record is kept in state by `id`, and replaced
+        at the end of the run. With `cdc_tombstones`, a record holding only the
+        `id` and `_sdc_deleted_at` is also yielded for every ID of the previous
+        run that is gone.
+
+        Args:
+            records: Every record of the stream.
+        """
+        previous = self.stream_state.get("record_fingerprints", {})
+        current: Dict[str, str] = {}
+        for record in records:
+            record_id = str(record["id"])
+            fingerprint = record_fingerprint(record)
+            current[record_id] = fingerprint
+            if previous.get(record_id) != fingerprint:
+                yield record
+
+        if self.config.get("cdc_tombstones"):
+            deleted_at = utc_now().isoformat()
+            for record_id in previous:
+                if record_id not in current:
+                    yield {"id": int(record_id), "_sdc_deleted_at": deleted_at}
+        self.stream_state["record_fingerprints"] = current
+
+    def decode_json(self, response: requests.Response) -> Any:
+        """Decode a JSON response with the tap's JSON backend.
+
+        Args:
+            response: A `requests.Response` object.
+
+        Returns:
+            The decoded body.
+        """
+        json_codec = self._tap.json_codec  # type: ignore[attr-defined]
+        start = time.perf_counter()
+        if json_codec is None:
+            payload = response.json()
+        else:
+            payload = json_codec.loads(response.content)
+        self.metrics.observe_parse(
+            self.name, self.get_endpoint(response.url), time.perf_counter() - start
+        )
+        return payload
+
+    @property
+    def record_conformer(self) -> RecordConformer:
+        """Return the record conformer compiled from the stream schema and mask."""
+        if self._record_conformer is None:
+            self._record_conformer = RecordConformer(
+                self.name,
+                self.schema,
+                self.mask,
+                self.logger,
+                validation=self.config.get("record_validation", "none"),
+                sample_rate=self.config.get("record_validation_sample_rate", 0.01),
+            )
+        return self._record_conformer
+
+    def _generate_record_messages(
+        self, record: dict
+    ) -> Generator[RecordMessage, None, None]:
+        """Yield the RECORD messages of a record, conformed by `record_conformer`.
+
+        Args:
+            record: A single stream record.
+
+        Yields:
+            Record message objects.
+        """
+        record = self.record_conformer(record)
+        for stream_map in self.stream_maps:
+            mapped_record = stream_map.transform(record)
+            # Emit record if not filtered
+            if mapped_record is not None:
+                yield RecordMessage(
+                    stream=stream_map.stream_alias,
+                    record=mapped_record,
+                    version=None,
+                    time_extracted=utc_now(),
+                )
+
+    def _write_record_message(self, record: dict) -> None:
+        """Write out a RECORD message, encoded with the tap's JSON backend.
+
+        The time spent conforming and writing the record is added to the tap's
+        metrics.
+
+        Args:
+            record: A single stream record.
+        """
+        json_codec = self._tap.json_codec  # type: ignore[attr-defined]
+        start = time.perf_counter()
+        record_messages = list(self._generate_record_messages(record))
+        conformed = time.perf_counter()
+        for record_message in record_messages:
+            if json_codec is None:
+                singer.write_message(record_message)
+            else:
+                sys.stdout.write(json_codec.dumps(record_message.asdict()) + "\n")
+                sys.stdout.flush()
+        self.metrics.observe_record(
+            self.name, conformed - start, time.perf_counter() - conformed
+        )
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Return the performance metrics shared by every stream of the tap."""
+        return self._tap.metrics  # type: ignore[attr-defined]
+
+    def get_endpoint(self, url: Optional[str]) -> str:
+        """Return the path template of a request URL, which keys its metrics.
+
+        Args:
+            url: Request URL.
+
+        Returns:
+            The path relative to `url_base` with IDs replaced by `{id}`, or the
+            stream path for URLs outside the API.
+        """
+        if isinstance(url, str) and url.startswith(self.url_base):
+            base_length = len(self.url_base)
+            return endpoint_template(url[base_length:])
+        return str(self.path)
+
+    @property
+    def stream_responses(self) -> bool:
+        """Return True if response bodies are decoded incrementally.
+
+        Never with a response cache or archive, which store whole bodies, so
+        `stream_responses` is ignored when either is configured.
+        """
+        return bool(self.config.get("stream_responses", False)) and not (
+            self.config.get("response_cache_path") or self.config.get("archive_path")
+        )
+
+    def is_streamed(self, url: Optional[str]) -> bool:
+        """Return True if the body of a request is left on the socket when sent.
+
+        Args:
+            url: Request URL.
+
+        Returns:
+            True with `stream_responses` for the `STREAMED_ENDPOINTS`, whose
+            bodies are decoded incrementally as they are read.
+        """
+        return self.stream_responses and self.get_endpoint(url) in STREAMED_ENDPOINTS
+
+    def iter_json_items(self, response: requests.Response) -> Iterator[Any]:
+        """Yield the items of a JSON array response.
+
+        With `stream_responses`, items are decoded one at a time as the body is
+        read from the socket; otherwise the whole body is decoded first.
+
+        Args:
+            response: A response whose body is a JSON array.
+
+        Yields:
+            Each decoded item.
+        """
+        if self.stream_responses:
+            yield from iter_array_items(response.iter_content(chunk_size=CHUNK_SIZE))
+        else:
+            yield from self.decode_json(response)
+
+    def decode_json_members(
+        self, response: requests.Response, keys: Iterable[str]
+    ) -> Dict[str, Any]:
+        """Decode the members `keys` of a JSON object response.
+
+        With `stream_responses`, the body is decoded incrementally and every
+        other member is discarded as it is read, so it is never held in memory.
+
+        Args:
+            response: A response whose body is a JSON object.
+            keys: Names of the members to keep.
+
+        Returns:
+            The kept members.
+        """
+        if self.stream_responses:
+            chunks = response.iter_content(chunk_size=CHUNK_SIZE)
+            return dict(iter_object_members(chunks, set(keys)))
+        payload = self.decode_json(response)
+        return {key: payload[key] for key in keys if key in payload}
+
+    @property
+    def http_headers(self) -> dict:
+        """Return the request headers, closing connections if keep-alive is off."""
+        headers = super().http_headers
+        if not self.config.get("http_keep_alive", True):
+            headers["Connection"] = "close"
+        return headers
+
+    @property
+    def max_concurrency(self) -> int:
+        """Return the number of requests a fan-out stream may keep in flight."""
+        return max(1, int(self.config.get("max_concurrency", 1)))
+
+    @property
+    def http_pool_maxsize(self) -> int:
+        """Return the number of connections kept open to the FPL host.
+
+        Defaults to enough connections for every concurrent request, and never
+        fewer than the `requests` default.
+        """
+        if self.config.get("http_pool_maxsize"):
+            return int(self.config["http_pool_maxsize"])
+        return max(self.max_concurrency, DEFAULT_POOLSIZE)
+
+    def request_many(
+        self,
+        context: Optional[dict],
+        keys: Iterable[Any],
+        prepare: Callable[[Any], requests.PreparedRequest],
+    ) -> Iterator[Tuple[Any, requests.Response]]:
+        """Send one request per key and yield `(key, response)` pairs in key order.
+
+        Up to `max_concurrency` requests are sent in parallel on a thread pool, or
+        as coroutines when the tap uses the asyncio request engine, but responses
+        are handed back in the order of `keys` so that records are emitted
+        deterministically whichever request completes first. Requests are
+        prepared on the calling thread and only a bounded window of keys is
+        submitted ahead of the consumer.
+
+        Args:
+            context: Stream partition or context dictionary.
+            keys: Request keys, e.g. `(manager_id, gameweek)` tuples.
+            prepare: Callable building the request for a key.
+
+        Yields:
+            A `(key, response)` tuple for every key.
+        """
+        async_engine = self._tap.async_engine  # type: ignore[attr-defined]
+        if async_engine is not None and self.archive_mode != "replay":
+            yield from self._iter_in_order(
+                keys, lambda key: async_engine.submit(self, prepare(key))
+            )
+            return
+
+        decorated_request = self.request_decorator(self._request)
+
+        if self.max_concurrency == 1:
+            for key in keys:
+                yield key, decorated_request(prepare(key), context)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        try:
+            yield from self._iter_in_order(
+                keys,
+                lambda key: executor.submit(decorated_request, prepare(key), context),
+            )
+        finally:
+            executor.shutdown(wait=True)
+
+    def _iter_in_order(
+        self, keys: Iterable[Any], submit: Callable[[Any], Future]
+    ) -> Iterator[Tuple[Any, Any]]:
+        """Submit one task per key and yield `(key, result)` pairs in key order.
+
+        At most twice `max_concurrency` tasks are submitted ahead of the one the
+        consumer is waiting for; tasks still pending when the consumer stops are
+        cancelled.
+        """
+        window = 2 * self.max_concurrency
+        in_flight: Deque[Tuple[Any, Future]] = deque()
+        try:
+            for key in keys:
+                in_flight.append((key, submit(key)))
+                if len(in_flight) >= window:
+                    key, future = in_flight.popleft()
+                    yield key, future.result()
+            while in_flight:
+                key, future = in_flight.popleft()
+                yield key, future.result()
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+
+    @property
+    def checkpoint_every(self) -> int:
+        """Return the number of completed requests between STATE checkpoints."""
+        return max(1, int(self.config.get("checkpoint_every", 500)))
+
+    @property
+    def checkpoint_interval(self) -> float:
+        """Return the minimum number of seconds between STATE checkpoints."""
+        return max(0.0, float(self.config.get("checkpoint_interval", 60)))
+
+    @property
+    def shard_count(self) -> int:
+        """Return the number of tap processes the fan-out work is split between."""
+        return max(1, int(self.config.get("shard_count", 1)))
+
+    @property
+    def shard_index(self) -> int:
+        """Return the shard of the fan-out work this process takes."""
+        return int(self.config.get("shard_index", 0))
+
+    def in_shard(self, key: Any) -> bool:
+        """Return True if a work key belongs to this process's shard."""
+        shard_count = self.shard_count
+        return shard_count == 1 or shard_of(key, shard_count) == self.shard_index
+
+    def iter_unfinished(self, keys: Iterable[Any]) -> Iterator[Tuple[int, Any]]:
+        """Yield `(position, key)` for the keys an interrupted run has not completed.
+
+        Keys must come in the same order on every run. The checkpoint left in
+        state by `checkpoint` records how many keys were completed and the last
+        of them; it is only trusted if there are at least as many keys and that
+        key is found at the same position again, otherwise the sequence changed
+        and every key is yielded.
+
+        Args:
+            keys: Request keys, in a stable order.
+
+        Yields:
+            Each remaining key with its position in `keys`.
+        """
+        keys = iter(keys)
+        start = 0
+        checkpoint = self.stream_state.get("checkpoint")
+        if checkpoint:
+            completed = list(islice(keys, checkpoint["position"]))
+            if (
+                len(completed) == checkpoint["position"]
+                and checkpoint_key(completed[-1]) == checkpoint["key"]
+            ):
+                start = len(completed)
+                self.logger.info(
+                    f"Resuming '{self.name}' after {start} completed requests, "
+                    f"from checkpoint {checkpoint['key']}."
+                )
+            else:
+                self.logger.warning(
+                    f"Checkpoint {checkpoint['key']} of '{self.name}' does not match "
+                    "this run's requests. Starting over."
+                )
+                keys = chain(completed, keys)
+        for position, key in enumerate(keys, start):
+            yield position, key
+
+    def checkpoint(self, position: int, key: Any) -> None:
+        """Record in state that every key up to `position` has been completed.
+
+        A STATE message is written once `checkpoint_every` keys have completed
+        and `checkpoint_interval` seconds have passed since the previous one, so
+        an interrupted run can be resumed by `iter_unfinished` without a large
+        state being re-serialized too often.
+
+        Args:
+            position: Position of the completed key, as yielded by `iter_unfinished`.
+            key: The completed key.
+        """
+        self.stream_state["checkpoint"] = {
+            "position": position + 1,
+            "key": checkpoint_key(key),
+        }
+        completed = position + 1 - self._checkpoint_position
+        elapsed = time.monotonic() - self._checkpoint_time
+        if completed >= self.checkpoint_every and elapsed >= self.checkpoint_interval:
+            self._write_state_message()
+            self._checkpoint_position = position + 1
+            self._checkpoint_time = time.monotonic()
+
+    def clear_checkpoint(self) -> None:
+        """Drop the checkpoint once every key has been completed."""
+        self.stream_state.pop("checkpoint", None)
+        self._checkpoint_position = 0
+
+    def prepare_path_request(
+        self, context: Optional[dict], path: str, params: Optional[dict] = None
+    ) -> requests.PreparedRequest:
+        """Prepare a GET request for an arbitrary API path.
+
+        Args:
+            context: Stream partition or context dictionary.
+            path: API path relative to `url_base`.
+            params: Optional URL query parameters.
+
+        Returns:
+            A request built with the stream's HTTP headers and authenticator.
+        """
+        params = dict(params or {})
+        headers = self.http_headers
+
+        authenticator = self.authenticator
+        if authenticator:
+            headers.update(authenticator.auth_headers or {})
+            params.update(authenticator.auth_params or {})
+
+        return self.requests_session.prepare_request(
+            requests.Request(
+                method=self.rest_method,
+                url="".join([self.url_base, path]),
+                params=params,
+                headers=headers,
+            ),
+        )
+
+    @property
+    def payload_cache(self) -> Dict[str, Any]:
+        """Return the decoded payloads shared by every stream of the tap."""
+        return self._tap.payload_cache  # type: ignore[attr-defined]
+
+    def request_payload(
+        self, context: Optional[dict], path: str, keys: Optional[Iterable[str]] = None
+    ) -> Any:
+        """Return the decoded body of `path`, requesting it at most once per run.
+
+        Decoded payloads are kept on the tap, so every stream slicing the same
+        document (e.g. the `/bootstrap-static` streams) shares a single download
+        and a single JSON parse.
+
+        Args:
+            context: Stream partition or context dictionary.
+            path: API path relative to `url_base`.
+            keys: Members of a JSON object payload to keep. The whole payload is
+                kept if omitted.
+
+        Returns:
+            The decoded JSON payload.
+        """
+        payload_cache = self.payload_cache
+        if path not in payload_cache:
+            decorated_request = self.request_decorator(self._request)
+            prepared_request = self.prepare_path_request(context, path)
+            response = decorated_request(prepared_request, context)
+            if keys is None:
+                payload_cache[path] = self.decode_json(response)
+            else:
+                payload_cache[path] = self.decode_json_members(response, keys)
+        return payload_cache[path]
+
+    def request_bootstrap(self, context: Optional[dict]) -> Dict[str, Any]:
+        """Return the members of `/bootstrap-static` used by this run.
+
+        These are the members sliced by the selected bootstrap streams, plus
+        `events` and `elements` which other streams resolve gameweeks and
+        players from.
+
+        Args:
+            context: Stream partition or context dictionary.
+
+        Returns:
+            The decoded members, keyed by name.
+        """
+        keys = {"events", "elements"}
+        for stream in self._tap.streams.values():  # type: ignore[attr-defined]
+            if stream.path == BOOTSTRAP_PATH and stream.selected:
+                keys.add(stream.payload_key)  # type: ignore[attr-defined]
+        return self.request_payload(context, BOOTSTRAP_PATH, keys)
+
+    def request_standings(
+        self, context: Optional[dict], league_id: int
+    ) -> Iterator[dict]:
+        """Yield the standings rows of a classic league page by page.
+
+        Pages are requested lazily through `page_standings` while the previous
+        page reports `has_next`, so only one page is held in memory at a time.
+
+        Args:
+            context: Stream partition or context dictionary.
+            league_id: Classic league ID.
 
+        Yields:
+            One row per league entry, tagged with the league ID and update time.
+        """
+        decorated_request = self.request_decorator(self._request)
+        path = f"/leagues-classic/{league_id}/standings"
+        page = 1
+        while True:
+            prepared_request = self.prepare_path_request(
+                context, path, params={"page_standings": page}
+            )
+            payload = self.decode_json_members(
+                decorated_request(prepared_request, context),
+                ["last_updated_data", "standings"],
+            )
+            for row in payload["standings"]["results"]:
+                row["league_id"] = league_id
+                row["last_updated_data"] = payload["last_updated_data"]
+                yield row
+            if not payload["standings"].get("has_next"):
+                return
+            page += 1
@@ -0,0 +1,71 @@
+"""Optional fast JSON backends for decoding responses and encoding messages."""
+
+import importlib
+import logging
+from decimal import Decimal
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+#: Backends tried, fastest first, when `json_backend` is "auto".
+FAST_BACKENDS = ("orjson", "ujson")
+
+
+class JSONCodec(NamedTuple):
+    """A JSON library's `loads` and `dumps`, normalised to text output."""
+
+    name: str
+    loads: Callable[[Union[bytes, str]], Any]
+    dumps: Callable[[Any], str]
+
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _load_codec(name: str) -> JSONCodec:
+    module = importlib.import_module(name)
+    if name == "orjson":
+        return JSONCodec(
+            name,
+            module.loads,  # type: ignore[attr-defined]
+            lambda value: module.dumps(  # type: ignore[attr-defined]
+                value, default=_orjson_default
+            ).decode(),
+        )
+    return JSONCodec(
+        name,
+        module.loads,  # type: ignore[attr-defined]
+        lambda value: module.dumps(  # type: ignore[attr-defined]
+            value, ensure_ascii=False
+        ),
+    )
+
+
+def get_codec(
+    backend: str, logger: Optional[logging.Logger] = None
+) -> Optional[JSONCodec]:
+    """Return the fast JSON codec for the `json_backend` setting.
+
+    Args:
+        backend: "stdlib", "auto" (the fastest installed library), or the name
+            of a library from `FAST_BACKENDS`.
+        logger: Logger warned when the requested library is not installed.
+
+    Returns:
+        The codec, or None to keep using the stdlib through `requests` and the
+        Singer SDK.
+    """
+    if backend == "stdlib":
+        return None
+    candidates = FAST_BACKENDS if backend == "auto" else (backend,)
+    for name in candidates:
+        try:
+            return _load_codec(name)
+        except ImportError:
+            continue
+    if logger and backend != "auto":
+        logger.warning(
+            f"JSON backend '{backend}' is not installed, falling back to the stdlib."
+        )
+    return None
@@ -0,0 +1,118 @@
+"""Per-stream record conformance and validation compiled once from the schema."""
+
+import logging
+from typing import Any, Dict, FrozenSet, Optional, Set
+
+from jsonschema.validators import validator_for
+from singer_sdk.helpers._catalog import pop_deselected_record_properties
+from singer_sdk.helpers._singer import SelectionMask
+from singer_sdk.helpers._typing import conform_record_data_types, is_boolean_type
+
+#: Value types that the SDK's conformance passes through unchanged.
+JSON_TYPES = frozenset([str, int, float, bool, type(None), dict, list])
+
+
+class InvalidRecordError(Exception):
+    """A record does not match its stream schema."""
+
+
+class RecordConformer:
+    """Schema-specialised replacement for the SDK's per-record conformance.
+
+    The SDK looks up the selection mask and the JSON schema of every property
+    of every record. Here both are resolved once into the set of selected
+    properties and the set of boolean properties, so conforming a record is a
+    single pass over its keys. Records holding values JSON cannot represent
+    (e.g. datetimes) and streams with nested deselected properties go through
+    the SDK helpers instead, so output is the same either way.
+
+    Conformed records can also be validated against the schema, every record or
+    one in every `1 / sample_rate`, with a validator compiled once.
+    """
+
+    def __init__(
+        self,
+        stream_name: str,
+        schema: dict,
+        mask: SelectionMask,
+        logger: logging.Logger,
+        validation: str = "none",
+        sample_rate: float = 0.01,
+    ) -> None:
+        """Compile the conformer for a stream's schema and selection mask."""
+        self.stream_name = stream_name
+        self.schema = schema
+        self.mask = mask
+        self.logger = logger
+        properties = schema.get("properties", {})
+        self.properties: FrozenSet[str] = frozenset(properties)
+        self.selected: FrozenSet[str] = frozenset(
+            name for name in properties if mask[("properties", name)]
+        )
+        self.booleans: FrozenSet[str] = frozenset(
+            name for name in self.selected if is_boolean_type(properties[name])
+        )
+        self.nested_deselection = any(
+            len(breadcrumb) > 2 and not selected
+            for breadcrumb, selected in mask.items()
+        )
+        self._unmapped: Set[str] = set()
+
+        self.validator: Optional[Any] = None
+        self.validate_every = 0
+        if validation != "none":
+            self.validator = validator_for(schema)(schema)
+            self.validate_every = 1 if validation == "all" else round(1 / sample_rate)
+        self.records = 0
+
+    def __call__(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the record conformed to the schema, validating it if sampled.
+
+        Raises:
+            InvalidRecordError: If a validated record does not match the schema.
+        """
+        if self.nested_deselection or not all(
+            type(value) in JSON_TYPES for value in record.values()
+        ):
+            pop_deselected_record_properties(
+                record, self.schema, self.mask, self.logger
+            )
+            conformed = conform_record_data_types(
+                self.stream_name, record, self.schema, self.logger
+            )
+        else:
+            conformed = {}
+            for name, value in record.items():
+                if name in self.selected:
+                    if name in self.booleans and value is not None:
+                        value = value != 0
+                    conformed[name] = value
+                elif name not in self.properties:
+                    self._warn_unmapped(name)
+
+        self.records += 1
+        if self.validator and self.records % self.validate_every == 0:
+            self.validate(conformed)
+        return conformed
+
+    def validate(self, record: Dict[str, Any]) -> None:
+        """Validate a conformed record against the compiled schema.
+
+        Raises:
+            InvalidRecordError: If the record does not match the schema.
+        """
+        error = next(self.validator.iter_errors(record), None)  # type: ignore
+        if error is not None:
+            path = ".".join(str(part) for part in error.absolute_path)
+            raise InvalidRecordError(
+                f"Record {self.records} of stream '{self.stream_name}' does not "
+                f"match its schema at '{path}': {error.message}"
+            )
+
+    def _warn_unmapped(self, name: str) -> None:
+        if name not in self._unmapped:
+            self._unmapped.add(name)
+            self.logger.warning(
+                f"Property '{name}' was present in the '{self.stream_name}' stream "
+                "but not found in catalog schema. Ignoring."
+            )
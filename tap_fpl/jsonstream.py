@@ -0,0 +1,147 @@
+"""Incremental decoding of JSON documents read from a response stream."""
+
+import codecs
+import json
+from typing import Any, Collection, Iterable, Iterator, Optional, Tuple
+
+#: Size of the chunks read from a streamed response body.
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]}"
+
+
+class _JSONStreamReader:
+    """Text buffer over a stream of byte chunks, decoded one value at a time.
+
+    Only the part of the document that has not been decoded yet is buffered, so
+    memory is bounded by the largest single value decoded rather than by the
+    whole document.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read the next chunk into the buffer, returning False at end of input."""
+        if self._eof:
+            return False
+        consumed = self._pos
+        if consumed > CHUNK_SIZE:
+            self._buffer = self._buffer[consumed:]
+            self._pos = 0
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer += self._decoder.decode(chunk)
+                return True
+        self._buffer += self._decoder.decode(b"", final=True)
+        self._eof = True
+        return False
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self._pos < len(self._buffer):
+                if self._buffer[self._pos] not in _WHITESPACE:
+                    return self._buffer[self._pos]
+                self._pos += 1
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, char: str) -> None:
+        """Consume `char`, which must be the next non-whitespace character."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON document, found {found!r}")
+        self._pos += 1
+
+    def decode(self) -> Any:
+        """Decode and consume the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number only ends at a delimiter, it may continue in the next chunk
+            if (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and (end == len(self._buffer) or self._buffer[end] not in _DELIMITERS)
+                and self._fill()
+            ):
+                continue
+            self._pos = end
+            return value
+
+    def iter_items(self) -> Iterator[Any]:
+        """Decode the items of the array starting at the next character."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.decode()
+            if self.peek() == "]":
+                self._pos += 1
+                return
+            self.expect(",")
+
+
+def iter_array_items(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array as they are decoded.
+
+    Args:
+        chunks: The document as a stream of byte chunks.
+
+    Yields:
+        Each decoded array item.
+    """
+    yield from _JSONStreamReader(chunks).iter_items()
+
+
+def iter_object_members(
+    chunks: Iterable[bytes], keys: Optional[Collection[str]] = None
+) -> Iterator[Tuple[str, Any]]:
+    """Yield the members of a top-level JSON object as they are decoded.
+
+    Members not in `keys` are skipped. Array members, whether kept or skipped,
+    are decoded one item at a time so that no single large array is buffered as
+    text.
+
+    Args:
+        chunks: The document as a stream of byte chunks.
+        keys: Member names to keep. All members are kept if omitted.
+
+    Yields:
+        A `(key, value)` tuple for each kept member.
+    """
+    reader = _JSONStreamReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.decode()
+        reader.expect(":")
+        wanted = keys is None or key in keys
+        if reader.peek() == "[":
+            items = reader.iter_items()
+            if wanted:
+                yield key, list(items)
+            else:
+                for _ in items:
+                    pass
+        else:
+            value = reader.decode()
+            if wanted:
+                yield key, value
+        if reader.peek() == "}":
+            return
+        reader.expect(",")
@@ -0,0 +1,202 @@
+"""Per-stream and per-endpoint performance metrics collected during a tap run."""
+
+import re
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Tuple
+
+#: Upper bounds, in seconds, of the request latency histogram buckets.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_template(path: str) -> str:
+    """Return the template of an API path, e.g. `/entry/{id}/event/{id}/picks`.
+
+    Args:
+        path: API path relative to the base URL, with or without a query string.
+    """
+    return _ID_SEGMENT.sub("/{id}", path.split("?", 1)[0].rstrip("/"))
+
+
+def _metric(type_: str, name: str, value: Any, tags: Dict[str, str]) -> Dict[str, Any]:
+    return {"type": type_, "metric": name, "value": value, "tags": dict(tags)}
+
+
+class EndpointMetrics:
+    """Request counters and latency histogram for one endpoint of a stream."""
+
+    def __init__(self) -> None:
+        """Start every counter at zero."""
+        self.requests = 0
+        self.retries = 0
+        self.bytes = 0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.parses = 0
+        self.parse_seconds = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the metrics as a JSON-serialisable dictionary."""
+        bounds = [str(bound) for bound in LATENCY_BUCKETS] + ["+Inf"]
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "latency": {
+                "sum": self.latency_sum,
+                "max": self.latency_max,
+                "buckets": dict(zip(bounds, self.latency_buckets)),
+            },
+            "parses": self.parses,
+            "parse_seconds": self.parse_seconds,
+        }
+
+
+class StreamMetrics:
+    """Record counters and timings for one stream."""
+
+    def __init__(self) -> None:
+        """Start every counter at zero."""
+        self.records = 0
+        self.conform_seconds = 0.0
+        self.write_seconds = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the metrics as a JSON-serialisable dictionary."""
+        return {
+            "records": self.records,
+            "conform_seconds": self.conform_seconds,
+            "write_seconds": self.write_seconds,
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe collection of the metrics of every stream of a tap run."""
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self.endpoints: Dict[Tuple[str, str], EndpointMetrics] = {}
+        self.streams: Dict[str, StreamMetrics] = {}
+        self.connections: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, stream: str, endpoint: str) -> EndpointMetrics:
+        key = (stream, endpoint)
+        if key not in self.endpoints:
+            self.endpoints[key] = EndpointMetrics()
+        return self.endpoints[key]
+
+    def _stream(self, stream: str) -> StreamMetrics:
+        if stream not in self.streams:
+            self.streams[stream] = StreamMetrics()
+        return self.streams[stream]
+
+    def observe_request(
+        self, stream: str, endpoint: str, seconds: float, size: int
+    ) -> None:
+        """Count a completed request, its latency and the bytes received."""
+        with self._lock:
+            metrics = self._endpoint(stream, endpoint)
+            metrics.requests += 1
+            metrics.bytes += size
+            metrics.latency_buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            metrics.latency_sum += seconds
+            metrics.latency_max = max(metrics.latency_max, seconds)
+
+    def observe_retry(self, stream: str, endpoint: str) -> None:
+        """Count a request attempt that failed and will be retried."""
+        with self._lock:
+            self._endpoint(stream, endpoint).retries += 1
+
+    def observe_parse(self, stream: str, endpoint: str, seconds: float) -> None:
+        """Count the time spent decoding a response body."""
+        with self._lock:
+            metrics = self._endpoint(stream, endpoint)
+            metrics.parses += 1
+            metrics.parse_seconds += seconds
+
+    def observe_record(
+        self, stream: str, conform_seconds: float, write_seconds: float
+    ) -> None:
+        """Count an emitted record and the time spent conforming and writing it."""
+        with self._lock:
+            metrics = self._stream(stream)
+            metrics.records += 1
+            metrics.conform_seconds += conform_seconds
+            metrics.write_seconds += write_seconds
+
+    def observe_connections(self, connections_opened: int, requests: int) -> None:
+        """Record how many connections the shared session opened for its requests."""
+        with self._lock:
+            self.connections = {
+                "connections_opened": connections_opened,
+                "requests": requests,
+                "reused_requests": max(requests - connections_opened, 0),
+            }
+
+    def connection_messages(self) -> List[Dict[str, Any]]:
+        """Return the Singer metrics of the shared session's connection reuse."""
+        with self._lock:
+            return [
+                _metric("counter", f"http_{name}", value, {})
+                for name, value in self.connections.items()
+            ]
+
+    def metric_messages(self, stream: str) -> List[Dict[str, Any]]:
+        """Return the Singer metrics of a stream, one per value and endpoint."""
+        messages: List[Dict[str, Any]] = []
+        with self._lock:
+            for (stream_name, endpoint), metrics in self.endpoints.items():
+                if stream_name != stream:
+                    continue
+                tags = {"stream": stream, "endpoint": endpoint}
+                latency = metrics.to_dict()["latency"]
+                messages += [
+                    _metric("counter", "http_request_count", metrics.requests, tags),
+                    _metric("counter", "http_request_retries", metrics.retries, tags),
+                    _metric("counter", "http_response_bytes", metrics.bytes, tags),
+                    _metric("histogram", "http_request_duration", latency, tags),
+                    _metric(
+                        "timer", "json_parse_duration", metrics.parse_seconds, tags
+                    ),
+                ]
+            if stream in self.streams:
+                stream_metrics = self.streams[stream]
+                tags = {"stream": stream}
+                messages += [
+                    _metric("counter", "records_emitted", stream_metrics.records, tags),
+                    _metric(
+                        "timer",
+                        "record_conform_duration",
+                        stream_metrics.conform_seconds,
+                        tags,
+                    ),
+                    _metric(
+                        "timer",
+                        "record_write_duration",
+                        stream_metrics.write_seconds,
+                        tags,
+                    ),
+                ]
+        return messages
+
+    def summary(self) -> Dict[str, Any]:
+        """Return every metric as a JSON-serialisable dictionary.
+
+        Stream metrics are keyed by stream name under `streams`, and connection
+        reuse of the shared session is under `connections`.
+        """
+        with self._lock:
+            streams: Dict[str, Any] = {
+                stream: {"endpoints": {}, **metrics.to_dict()}
+                for stream, metrics in self.streams.items()
+            }
+            for (stream, endpoint), endpoint_metrics in self.endpoints.items():
+                stream_summary = streams.setdefault(
+                    stream, {"endpoints": {}, **StreamMetrics().to_dict()}
+                )
+                stream_summary["endpoints"][endpoint] = endpoint_metrics.to_dict()
+            return {"streams": streams, "connections": dict(self.connections)}
@@ -0,0 +1,110 @@
+"""Client-side rate limiting shared by every stream of a tap run."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Return the number of seconds requested by a `Retry-After` header.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date.
+
+    Returns:
+        The delay in seconds, or None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RateLimiter:
+    """Thread-safe token bucket with adaptive (AIMD) rate control.
+
+    Requests spend one token each, and tokens refill at the current rate up to a
+    burst of one second's worth of requests. A `429 Too Many Requests` halves the
+    current rate and pauses every caller for the server's `Retry-After`; each
+    successful response then raises the rate back towards the configured
+    maximum by a small fixed step.
+    """
+
+    #: Fraction of the configured rate recovered after each successful response.
+    recovery_step = 0.02
+    #: Lowest rate the limiter will back off to, in requests per second.
+    min_rate = 0.1
+
+    def __init__(self, requests_per_second: float) -> None:
+        """Create a limiter allowing `requests_per_second` at most."""
+        self.max_rate = float(requests_per_second)
+        self.rate = self.max_rate
+        self.capacity = max(1.0, self.max_rate)
+        self.requests = 0
+        self.throttled = 0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            if self._started is None:
+                self._started = now
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            self.requests += 1
+            return max(self._blocked_until - now, -self._tokens / self.rate, 0.0)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """Back off after the API answered `429 Too Many Requests`.
+
+        Args:
+            retry_after: Seconds requested by the server, if it said.
+        """
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.rate / 2, self.min_rate)
+            pause = retry_after if retry_after is not None else 1 / self.rate
+            self._blocked_until = max(self._blocked_until, time.monotonic() + pause)
+
+    def recover(self) -> None:
+        """Step the rate back up after a successful response."""
+        with self._lock:
+            self.rate = min(
+                self.max_rate, self.rate + self.max_rate * self.recovery_step
+            )
+
+    def stats(self) -> Dict[str, float]:
+        """Return the request count and the effective and current rates."""
+        with self._lock:
+            elapsed = time.monotonic() - self._started if self._started else 0.0
+            return {
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "effective_rate": self.requests / elapsed if elapsed else 0.0,
+                "current_rate": self.rate,
+            }
@@ -1,62 +1,178 @@
 """Stream type classes for tap-fpl."""
 import copy
 import requests
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Optional, Union, List, Iterable, cast
+from typing import (
+    Any, Dict, Optional, Set, Tuple, Union, List, Iterable, Iterator, cast
+)
 
 from singer_sdk import typing as th  # JSON Schema typing helpers
 from singer_sdk.helpers.jsonpath import extract_jsonpath
 
-from tap_fpl.client import FPLStream
+from tap_fpl.client import BOOTSTRAP_PATH, FPLStream, record_fingerprint
 
 SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
 
-class EventsStream(FPLStream):
-    name = "events"
-    path = "/bootstrap-static"
+ELEMENT_SUMMARY_PATH = "/element-summary/{player_id}"
+PICKS_PATH = "/entry/{manager_id}/event/{gameweek}/picks"
+MANAGER_HISTORY_PATH = "/entry/{manager_id}/history"
+MANAGER_TRANSFERS_PATH = "/entry/{manager_id}/transfers"
+LIVE_PATH = "/event/{gameweek}/live"
+
+class BootstrapStream(FPLStream):
+    """Base class for streams sliced from the shared `/bootstrap-static` payload."""
+    path = BOOTSTRAP_PATH
     primary_keys = ["id"]
-    schema_filepath = SCHEMAS_DIR / "events.json"
+    payload_key = ""
+    supports_cdc = True
 
-    def parse_response(self, response: requests.Response) -> Iterable[dict]:
-        return response.json()['events']
+    def request_records(self, context: Optional[dict]) -> Iterable[dict]:
+        yield from self.request_bootstrap(context)[self.payload_key]
+
+class PayloadChildStream(FPLStream):
+    """Base class for flat streams exploded from the payload of their parent.
+
+    Rows are read from the decoded response the parent stream has just shared
+    through the tap payload cache under `path`, so no extra request is made.
+    Each row is tagged with the child context, and streams with a replication
+    key only emit rows from the bookmark of their state partition onwards. Rows
+    at the bookmark are emitted again, so a match row corrected after it was
+    first emitted (e.g. its bonus points) reaches the loader.
+    """
+    payload_key = ""
+    _schema_written = False
+
+    def _write_schema_message(self) -> None:
+        """Write the SCHEMA message on the first sync of the run only.
+
+        The SDK syncs a child stream once per parent record, and would otherwise
+        repeat the SCHEMA message every time.
+        """
+        if not self._schema_written:
+            super()._write_schema_message()
+            self._schema_written = True
+
+    def _write_state_message(self) -> None:
+        """Leave STATE messages to the parent stream.
+
+        Child state is part of the tap state, which the parent writes at every
+        checkpoint and at the end of its sync, so writing it again after each
+        parent record would only repeat it.
+        """
 
-class TeamsStream(FPLStream):
+    def request_records(self, context: Optional[dict]) -> Iterable[dict]:
+        # Always set, as child streams are only synced with their parent's context
+        child_context = cast(dict, context)
+        payload = self.request_payload(context, self.path.format(**child_context))
+        rows = payload[self.payload_key]
+        if isinstance(rows, dict):
+            rows = [rows]
+        bookmark = None
+        if self.replication_key:
+            bookmark = self.get_starting_replication_key_value(context)
+        for row in rows:
+            value = row.get(self.replication_key) if self.replication_key else None
+            if bookmark is not None and value is not None and value < bookmark:
+                continue
+            row = dict(row)
+            row.update(child_context)
+            yield row
+
+class EventsStream(BootstrapStream):
+    name = "events"
+    payload_key = "events"
+    schema_filepath = SCHEMAS_DIR / "events.json"
+
+class TeamsStream(BootstrapStream):
     name = "teams"
-    path = "/bootstrap-static"
-    primary_keys = ["id"]
+    payload_key = "teams"
     schema_filepath = SCHEMAS_DIR / "teams.json"
 
-    def parse_response(self, response: requests.Response) -> Iterable[dict]:
-        return response.json()['teams']
-
-class ElementsStream(FPLStream):
+class ElementsStream(BootstrapStream):
     name = "elements"
-    path = "/bootstrap-static"
-    primary_keys = ["id"]
+    payload_key = "elements"
     schema_filepath = SCHEMAS_DIR / "elements.json"
 
-    def parse_response(self, response: requests.Response) -> Iterable[dict]:
-        return response.json()['elements']
-
-class ElementTypesStream(FPLStream):
+class ElementTypesStream(BootstrapStream):
     name = "element-types"
-    path = "/bootstrap-static"
-    primary_keys = ["id"]
+    payload_key = "element_types"
     schema_filepath = SCHEMAS_DIR / "element_types.json"
 
-    def parse_response(self, response: requests.Response) -> Iterable[dict]:
-        return response.json()['element_types']
-
 class FixturesStream(FPLStream):
     name = "fixtures"
     path = "/fixtures"
     primary_keys = ["id"]
     schema_filepath = SCHEMAS_DIR / "fixtures.json"
+    supports_cdc = True
 
     def parse_response(self, response: requests.Response) -> Iterable[dict]:
-        return response.json()
+        yield from self.iter_json_items(response)
+
+class ManagerStream(FPLStream):
+    """Base class for streams fanned out over the configured managers.
 
-class SelectionsStream(FPLStream):
+    State is kept in one manual partition per manager, which is only read and
+    written by the stream itself.
+    """
+
+    @property
+    def partitions(self) -> Optional[List[dict]]:
+        """Sync every manager in a single pass.
+
+        Per-manager partitions only carry state, so they must not be picked up by
+        the SDK as contexts to sync one at a time.
+        """
+        return None
+
+    def get_manager_ids(self, context: Optional[dict]) -> Iterator[int]:
+        """Yield each manager ID once, in order.
+
+        Configured `managers` come first, followed by the entries of every
+        league in `manager_league_ids`. Standings pages are only requested as
+        the managers on the previous page are consumed. With `shard_count` set,
+        only managers in this process's shard are yielded, so each manager's
+        rows and state are kept by a single shard.
+
+        The resolved list is kept on the tap once complete, so the standings
+        are only walked by the first manager stream of a run.
+        """
+        if self._tap.manager_ids is not None:  # type: ignore[attr-defined]
+            yield from self._tap.manager_ids  # type: ignore[attr-defined]
+            return
+        league_entries = (
+            row['entry']
+            for league_id in self.config.get('manager_league_ids', [])
+            for row in self.request_standings(context, league_id)
+        )
+        manager_ids: List[int] = []
+        seen: Set[int] = set()
+        for manager_id in chain(self.config['managers'], league_entries):
+            if manager_id not in seen and self.in_shard(manager_id):
+                seen.add(manager_id)
+                manager_ids.append(manager_id)
+                yield manager_id
+        self._tap.manager_ids = manager_ids  # type: ignore[attr-defined]
+
+    def get_manager_states(self) -> Dict[int, dict]:
+        """Index the per-manager state partitions by manager ID."""
+        return {
+            partition['context']['manager_id']: partition
+            for partition in self.stream_state.get('partitions', [])
+        }
+
+    def get_manager_state(
+        self, manager_states: Dict[int, dict], manager_id: int
+    ) -> dict:
+        """Return the state partition of a manager, adding it if missing."""
+        if manager_id not in manager_states:
+            manager_states[manager_id] = {'context': {'manager_id': manager_id}}
+            self.stream_state.setdefault('partitions', []).append(
+                manager_states[manager_id]
+            )
+        return manager_states[manager_id]
+
+class SelectionsStream(ManagerStream):
     name = "selections"
     path = ''
     primary_keys = ["manager_id", "gameweek"]
@@ -74,7 +190,7 @@ class SelectionsStream(FPLStream):
         Returns:
             A URL, optionally targeted to a specific partition or context.
         """
-        path = "".join(['/entry/', str(manager_id), '/event/', str(gameweek), '/picks'])
+        path = PICKS_PATH.format(manager_id=manager_id, gameweek=gameweek)
         url = "".join([self.url_base, path or ""])
         vals = copy.copy(dict(self.config))
         vals.update(context or {})
@@ -142,41 +258,323 @@ class SelectionsStream(FPLStream):
             RuntimeError: If a loop in pagination is detected. That is, when two
                 consecutive pagination tokens are identical.
         """
-        decorated_request = self.request_decorator(self._request)
+        gameweek_mode = self.config.get('gameweek_mode', 'config')
+        gameweeks = self.get_gameweeks(context)
+        finished_gameweeks: Set[int] = set()
+        if self.config.get('skip_finished_gameweeks') or gameweek_mode == 'since_state':
+            finished_gameweeks = self.get_finished_gameweeks(context)
+        manager_states = self.get_manager_states()
+        for manager_state in manager_states.values():
+            self.compact_synced_gameweeks(manager_state)
+
+        keys = (
+            (position, (manager_id, gameweek))
+            for position, (manager_id, gameweek) in self.iter_unfinished(
+                self.get_picks_keys(context, gameweeks)
+            )
+            if not (
+                gameweek in finished_gameweeks
+                and gameweek
+                <= manager_states.get(manager_id, {}).get('synced_through_gameweek', 0)
+            )
+        )
+        responses = self.request_many(
+            context, keys, lambda key: self.prepare_request(context, *key[1])
+        )
+        for (position, (manager_id, gameweek)), resp in responses:
+            for row in self.parse_response(resp, manager_id, gameweek):
+                yield row
+            # Child streams have synced by now, so the shared payload can go
+            self.payload_cache.pop(
+                PICKS_PATH.format(manager_id=manager_id, gameweek=gameweek), None
+            )
+            if gameweek in finished_gameweeks:
+                self.mark_gameweek_synced(manager_states, manager_id, gameweek)
+            self.checkpoint(position, (manager_id, gameweek))
+        self.clear_checkpoint()
+
+        if gameweek_mode == 'since_state':
+            for gameweek in sorted(gameweeks):
+                if gameweek not in finished_gameweeks:
+                    break
+                self.stream_state['synced_through_gameweek'] = gameweek
+
+    def get_picks_keys(
+        self, context: Optional[dict], gameweeks: List[int]
+    ) -> Iterator[Tuple[int, int]]:
+        """Yield `(manager_id, gameweek)` pairs, gameweek by gameweek.
+
+        Managers are resolved lazily while the first gameweek is fanned out and
+        remembered for the following ones, so league standings are only walked
+        once per run.
+        """
+        manager_ids: List[int] = []
+        for index, gameweek in enumerate(gameweeks):
+            if index == 0:
+                for manager_id in self.get_manager_ids(context):
+                    manager_ids.append(manager_id)
+                    yield manager_id, gameweek
+            else:
+                for manager_id in manager_ids:
+                    yield manager_id, gameweek
+
+    def get_gameweeks(self, context: Optional[dict]) -> List[int]:
+        """Return the gameweeks to request picks for.
+
+        Depending on the `gameweek_mode` setting, gameweeks are either read from
+        the `gameweeks` setting or resolved from the bootstrap events:
+
+        - `finished`: every finished gameweek.
+        - `current`: the gameweek currently in progress.
+        - `since_state`: every gameweek with data after the last gameweek whose
+          picks were fully synced by a previous run.
+        """
+        gameweek_mode = self.config.get('gameweek_mode', 'config')
+        if gameweek_mode == 'config':
+            return list(self.config['gameweeks'])
+
+        events = self.request_bootstrap(context)['events']
+        if gameweek_mode == 'finished':
+            return [event['id'] for event in events if event['finished']]
+        if gameweek_mode == 'current':
+            return [event['id'] for event in events if event['is_current']]
+
+        synced_through = self.stream_state.get('synced_through_gameweek', 0)
+        return [
+            event['id'] for event in events
+            if (event['finished'] or event['is_current'])
+            and event['id'] > synced_through
+        ]
+
+    def get_finished_gameweeks(self, context: Optional[dict]) -> Set[int]:
+        """Return the gameweeks whose picks can no longer change."""
+        events = self.request_bootstrap(context)['events']
+        return {
+            event['id'] for event in events
+            if event['finished'] and event['data_checked']
+        }
+
+    def mark_gameweek_synced(
+        self, manager_states: Dict[int, dict], manager_id: int, gameweek: int
+    ) -> None:
+        """Record in state that a finished gameweek was emitted for a manager.
+
+        Each manager keeps only the last gameweek through which every gameweek
+        was synced, which advances when the next one is emitted.
+        """
+        manager_state = self.get_manager_state(manager_states, manager_id)
+        if gameweek == manager_state.get('synced_through_gameweek', 0) + 1:
+            manager_state['synced_through_gameweek'] = gameweek
 
-        for gameweek in self.config['gameweeks']:
-            for manager_id in self.config['managers']:
-                prepared_request = self.prepare_request(context, manager_id, gameweek)
-                resp = decorated_request(prepared_request, context)
-                for row in self.parse_response(resp, manager_id, gameweek):
-                    yield row
+    @staticmethod
+    def compact_synced_gameweeks(manager_state: dict) -> None:
+        """Replace a `finished_gameweeks` list left by an older version.
+
+        The list is folded into `synced_through_gameweek`, keeping the gameweeks
+        synced without a gap from the first one.
+        """
+        synced = manager_state.pop('finished_gameweeks', None)
+        if synced is None:
+            return
+        synced_through = manager_state.get('synced_through_gameweek', 0)
+        for gameweek in sorted(synced):
+            if gameweek == synced_through + 1:
+                synced_through = gameweek
+        manager_state['synced_through_gameweek'] = synced_through
 
     
     def parse_response(self, response: requests.Response, manager_id, gameweek) -> Iterable[dict]:
-        edited_response = response.json()
+        edited_response = self.decode_json(response)
         edited_response['manager_id'] = manager_id
         edited_response['gameweek'] = gameweek
+        if self.child_streams:
+            path = PICKS_PATH.format(manager_id=manager_id, gameweek=gameweek)
+            self.payload_cache[path] = edited_response
         yield from extract_jsonpath(self.records_jsonpath, input=edited_response)
 
+    def get_child_context(self, record: dict, context: Optional[dict]) -> dict:
+        return {'manager_id': record['manager_id'], 'gameweek': record['gameweek']}
+
+class ManagerBookmarkedStream(ManagerStream):
+    """Base class for per-manager streams synced incrementally.
+
+    One request per manager is fanned out like the picks requests. Each
+    manager's partition keeps the highest `bookmark_key` value emitted, and
+    later runs skip the rows before it. With `reemit_bookmark`, rows at the
+    bookmark are emitted again so that, e.g., a gameweek still in progress is
+    refreshed until it ends; otherwise they are skipped too.
+    """
+    bookmark_key = ""
+    reemit_bookmark = False
+
+    def request_records(self, context: Optional[dict]) -> Iterable[dict]:
+        manager_states = self.get_manager_states()
+        responses = self.request_many(
+            context,
+            self.iter_unfinished(self.get_manager_ids(context)),
+            lambda key: self.prepare_path_request(
+                context, self.path.format(manager_id=key[1])
+            ),
+        )
+        for (position, manager_id), response in responses:
+            bookmark = manager_states.get(manager_id, {}).get('replication_key_value')
+            latest = bookmark
+            for row in self.parse_response(response):
+                value = row.get(self.bookmark_key)
+                if bookmark is not None and value is not None and (
+                    value < bookmark
+                    or value == bookmark and not self.reemit_bookmark
+                ):
+                    continue
+                row['manager_id'] = manager_id
+                yield row
+                if value is not None and (latest is None or value > latest):
+                    latest = value
+            if latest != bookmark:
+                manager_state = self.get_manager_state(manager_states, manager_id)
+                manager_state['replication_key'] = self.bookmark_key
+                manager_state['replication_key_value'] = latest
+            self.checkpoint(position, manager_id)
+        self.clear_checkpoint()
+
+class ManagerHistoryStream(ManagerBookmarkedStream):
+    name = "manager_history"
+    path = MANAGER_HISTORY_PATH
+    primary_keys = ["manager_id", "event"]
+    schema_filepath = SCHEMAS_DIR / "manager_history.json"
+    bookmark_key = "event"
+    reemit_bookmark = True
+
+    def parse_response(self, response: requests.Response) -> Iterable[dict]:
+        yield from self.decode_json_members(response, ['current'])['current']
+
+class ManagerTransfersStream(ManagerBookmarkedStream):
+    name = "manager_transfers"
+    path = MANAGER_TRANSFERS_PATH
+    primary_keys = ["manager_id", "time", "element_in", "element_out"]
+    schema_filepath = SCHEMAS_DIR / "manager_transfers.json"
+    bookmark_key = "time"
+
+    def parse_response(self, response: requests.Response) -> Iterable[dict]:
+        yield from self.iter_json_items(response)
+
+class SelectionChildStream(PayloadChildStream):
+    """Base class for flat streams exploded from a SelectionsStream payload.
+
+    Rows are synced full table, so state is not partitioned per manager and
+    gameweek.
+    """
+    parent_stream_type = SelectionsStream
+    path = PICKS_PATH
+    state_partitioning_keys: List[str] = []
+
+class SelectionPicksStream(SelectionChildStream):
+    name = "selection_picks"
+    primary_keys = ["manager_id", "gameweek", "position"]
+    schema_filepath = SCHEMAS_DIR / "selection_picks.json"
+    payload_key = "picks"
+
+class SelectionAutoSubsStream(SelectionChildStream):
+    name = "selection_auto_subs"
+    primary_keys = ["manager_id", "gameweek", "element_out"]
+    schema_filepath = SCHEMAS_DIR / "selection_auto_subs.json"
+    payload_key = "automatic_subs"
+
+class SelectionEntryHistoryStream(SelectionChildStream):
+    name = "selection_entry_history"
+    primary_keys = ["manager_id", "gameweek"]
+    schema_filepath = SCHEMAS_DIR / "selection_entry_history.json"
+    payload_key = "entry_history"
+
 class StandingsStream(FPLStream):
     name = "standings"
-    primary_keys = ["league_id"]
+    path = "/leagues-classic/{league_id}/standings"
+    primary_keys = ["league_id", "entry"]
     replication_key = "last_updated_data"
     schema_filepath = SCHEMAS_DIR / "standings.json"
-    records_jsonpath = "$" 
 
     @property
-    def path(self):
-        return f'/leagues-classic/{self.config["league_id"]}/standings'
+    def partitions(self) -> List[dict]:
+        """Return one partition per configured classic league."""
+        league_ids = self.config.get('league_ids') or [self.config['league_id']]
+        return [{'league_id': league_id} for league_id in league_ids]
 
-    def parse_response(self, response: requests.Response) -> Iterable[dict]:
-        yield from extract_jsonpath(self.records_jsonpath, input=response.json())
+    def request_records(self, context: Optional[dict]) -> Iterable[dict]:
+        # Always set, as the stream is synced one league partition at a time
+        league_id = cast(dict, context)['league_id']
+        yield from self.request_standings(context, league_id)
+
+class LiveElementStatsStream(FPLStream):
+    """Per-element stats of a gameweek from its single live endpoint.
+
+    Each element's `stats` and `explain` blocks are fingerprinted in the state
+    of its gameweek partition, and only elements whose fingerprint changed
+    since the previous run are emitted, so intraday polls cost one request per
+    unfinished gameweek and emit only the delta.
+    """
+    name = "live_element_stats"
+    path = LIVE_PATH
+    primary_keys = ["gameweek", "id"]
+    schema_filepath = SCHEMAS_DIR / "live_element_stats.json"
+    live_change_keys = ["stats", "explain"]
+
+    @property
+    def partitions(self) -> Optional[List[dict]]:
+        """Return one partition per gameweek to poll.
+
+        Gameweeks are the configured `gameweeks` that are not finished yet when
+        `gameweek_mode` is `config`, and otherwise the gameweek currently in
+        progress. The state partitions of finished gameweeks are dropped, as
+        their stats no longer change.
+        """
+        events = self.request_bootstrap(None)['events']
+        finished_gameweeks = {
+            event['id'] for event in events
+            if event['finished'] and event['data_checked']
+        }
+        if self.config.get('gameweek_mode', 'config') == 'config':
+            gameweeks = [
+                gameweek for gameweek in self.config['gameweeks']
+                if gameweek not in finished_gameweeks
+            ]
+        else:
+            gameweeks = [event['id'] for event in events if event['is_current']]
+
+        if 'partitions' in self.stream_state:
+            self.stream_state['partitions'] = [
+                partition for partition in self.stream_state['partitions']
+                if partition['context'].get('gameweek') not in finished_gameweeks
+            ]
+        return [{'gameweek': gameweek} for gameweek in gameweeks] or None
+
+    def request_records(self, context: Optional[dict]) -> Iterable[dict]:
+        if not context:
+            return
+        path = LIVE_PATH.format(**context)
+        elements = self.request_payload(context, path, keys=['elements'])['elements']
+        # Live stats change between polls, so the payload must not outlive the sync
+        self.payload_cache.pop(path, None)
+
+        fingerprints = self.get_context_state(context).setdefault(
+            'element_fingerprints', {}
+        )
+        for element in elements:
+            fingerprint = record_fingerprint(element, self.live_change_keys)
+            if fingerprints.get(str(element['id'])) == fingerprint:
+                continue
+            row = {'gameweek': context['gameweek'], 'id': element['id']}
+            row.update(element.get('stats') or {})
+            row['explain'] = element.get('explain')
+            yield row
+            fingerprints[str(element['id'])] = fingerprint
 
 class PlayerDetailsStream(FPLStream):
     name = "player_details"
     path = ''
+    primary_keys = ["player_id"]
     schema_filepath = SCHEMAS_DIR / "player_details.json"
     records_jsonpath = "$" 
+    element_change_keys = ["event_points", "transfers_in_event", "news_added"]
 
     def get_url(self, context: Optional[dict], player_id) -> str:
         """Get stream entity URL.
@@ -189,7 +587,7 @@ class PlayerDetailsStream(FPLStream):
         Returns:
             A URL, optionally targeted to a specific partition or context.
         """
-        path = f'/element-summary/{player_id}'
+        path = ELEMENT_SUMMARY_PATH.format(player_id=player_id)
         url = "".join([self.url_base, path or ""])
         vals = copy.copy(dict(self.config))
         vals.update(context or {})
@@ -257,17 +655,96 @@ class PlayerDetailsStream(FPLStream):
             RuntimeError: If a loop in pagination is detected. That is, when two
                 consecutive pagination tokens are identical.
         """
-        decorated_request = self.request_decorator(self._request)
-
-        for player_id in self.config['players']:
-            prepared_request = self.prepare_request(context, player_id)
-            resp = decorated_request(prepared_request, context)
+        player_mode = self.config.get('player_mode', 'config')
+        if player_mode == 'config':
+            player_ids = list(self.config['players'])
+            fingerprints: Dict[int, str] = {}
+        else:
+            player_ids, fingerprints = self.get_element_players(context)
+        player_ids = [player_id for player_id in player_ids if self.in_shard(player_id)]
+
+        responses = self.request_many(
+            context,
+            self.iter_unfinished(player_ids),
+            lambda key: self.prepare_request(context, key[1]),
+        )
+        for (position, player_id), resp in responses:
             for row in self.parse_response(resp, player_id):
                 yield row
+            # Child streams have synced by now, so the shared payload can go
+            self.payload_cache.pop(
+                ELEMENT_SUMMARY_PATH.format(player_id=player_id), None
+            )
+            if player_id in fingerprints:
+                self.stream_state.setdefault('element_fingerprints', {})[
+                    str(player_id)
+                ] = fingerprints[player_id]
+            self.checkpoint(position, player_id)
+        self.clear_checkpoint()
+
+    def get_element_players(
+        self, context: Optional[dict]
+    ) -> Tuple[List[int], Dict[int, str]]:
+        """Return player IDs from the bootstrap elements and their fingerprints.
+
+        In `elements_changed` mode only players whose `event_points`,
+        `transfers_in_event` or `news_added` changed since the last run are
+        returned. Fingerprints are stored in state once a player is emitted.
+        """
+        elements = self.request_bootstrap(context)['elements']
+        fingerprints = {
+            element['id']: record_fingerprint(element, self.element_change_keys)
+            for element in elements
+        }
+        if self.config.get('player_mode') != 'elements_changed':
+            return list(fingerprints), fingerprints
+
+        previous = self.stream_state.get('element_fingerprints', {})
+        player_ids = [
+            player_id for player_id, fingerprint in fingerprints.items()
+            if previous.get(str(player_id)) != fingerprint
+        ]
+        return player_ids, fingerprints
 
     
     def parse_response(self, response: requests.Response, player_id) -> Iterable[dict]:
-        yield from extract_jsonpath(self.records_jsonpath, input=response.json())
+        edited_response = self.decode_json(response)
+        edited_response['player_id'] = player_id
+        if self.child_streams:
+            path = ELEMENT_SUMMARY_PATH.format(player_id=player_id)
+            self.payload_cache[path] = edited_response
+        yield from extract_jsonpath(self.records_jsonpath, input=edited_response)
+
+    def get_child_context(self, record: dict, context: Optional[dict]) -> dict:
+        return {'player_id': record['player_id']}
+
+class PlayerSummaryStream(PayloadChildStream):
+    """Base class for flat streams exploded from a PlayerDetailsStream payload."""
+    parent_stream_type = PlayerDetailsStream
+    path = ELEMENT_SUMMARY_PATH
+    state_partitioning_keys = ["player_id"]
+
+class PlayerHistoryStream(PlayerSummaryStream):
+    name = "player_history"
+    primary_keys = ["player_id", "fixture"]
+    replication_key = "kickoff_time"
+    schema_filepath = SCHEMAS_DIR / "player_history.json"
+    payload_key = "history"
+
+class PlayerFixturesStream(PlayerSummaryStream):
+    name = "player_fixtures"
+    primary_keys = ["player_id", "id"]
+    schema_filepath = SCHEMAS_DIR / "player_fixtures.json"
+    payload_key = "fixtures"
+    # Synced full table, so state is not partitioned per player
+    state_partitioning_keys: List[str] = []
+
+class PlayerHistoryPastStream(PlayerSummaryStream):
+    name = "player_history_past"
+    primary_keys = ["player_id", "season_name"]
+    replication_key = "season_name"
+    schema_filepath = SCHEMAS_DIR / "player_history_past.json"
+    payload_key = "history_past"
 
 
 class GroupsStream(FPLStream):
@@ -1,12 +1,24 @@
 """FPL tap class."""
 
-from typing import List
+import json
+from typing import Any, Dict, List, Optional, Type
+
+import requests
 
 from singer_sdk import Tap, Stream
 from singer_sdk import typing as th  # JSON schema typing helpers
+from singer_sdk.exceptions import ConfigValidationError
+from singer_sdk.streams.rest import DEFAULT_REQUEST_TIMEOUT
 
 from pathlib import Path
 
+from tap_fpl.aio import AsyncRequestEngine
+from tap_fpl.archive import ResponseArchive
+from tap_fpl.cache import DEFAULT_MAX_BYTES, ResponseCache
+from tap_fpl.client import DEFAULT_API_URL, connection_stats
+from tap_fpl.codec import JSONCodec, get_codec
+from tap_fpl.metrics import MetricsRegistry
+from tap_fpl.ratelimit import RateLimiter
 from tap_fpl.streams import (
     FPLStream,
     EventsStream,
@@ -15,8 +27,17 @@ from tap_fpl.streams import (
     ElementTypesStream,
     FixturesStream,
     SelectionsStream,
+    SelectionPicksStream,
+    SelectionAutoSubsStream,
+    SelectionEntryHistoryStream,
+    ManagerHistoryStream,
+    ManagerTransfersStream,
     StandingsStream,
-    PlayerDetailsStream
+    LiveElementStatsStream,
+    PlayerDetailsStream,
+    PlayerHistoryStream,
+    PlayerFixturesStream,
+    PlayerHistoryPastStream
 )
 
 STREAM_TYPES = {
@@ -26,8 +47,17 @@ STREAM_TYPES = {
     'element-types': ElementTypesStream,
     'fixtures': FixturesStream,
     'selections': SelectionsStream,
+    'selection-picks': SelectionPicksStream,
+    'selection-auto-subs': SelectionAutoSubsStream,
+    'selection-entry-history': SelectionEntryHistoryStream,
+    'manager-history': ManagerHistoryStream,
+    'manager-transfers': ManagerTransfersStream,
     'standings': StandingsStream,
-    'player-details': PlayerDetailsStream
+    'live-element-stats': LiveElementStatsStream,
+    'player-details': PlayerDetailsStream,
+    'player-history': PlayerHistoryStream,
+    'player-fixtures': PlayerFixturesStream,
+    'player-history-past': PlayerHistoryPastStream
 }
 
 SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
@@ -61,6 +91,129 @@ class TapFPL(Tap):
                 },
                 "default": []
             },
+            "manager_league_ids": {
+                "type": "array",
+                "items": {
+                    "type": "integer"
+                },
+                "default": []
+            },
+            "league_id": {
+                "type": "integer"
+            },
+            "league_ids": {
+                "type": "array",
+                "items": {
+                    "type": "integer"
+                }
+            },
+            "api_url": {
+                "type": "string",
+                "default": DEFAULT_API_URL
+            },
+            "gameweek_mode": {
+                "type": "string",
+                "enum": ["config", "finished", "current", "since_state"],
+                "default": "config"
+            },
+            "player_mode": {
+                "type": "string",
+                "enum": ["config", "elements", "elements_changed"],
+                "default": "config"
+            },
+            "skip_finished_gameweeks": {
+                "type": "boolean",
+                "default": False
+            },
+            "cdc_mode": {
+                "type": "boolean",
+                "default": False
+            },
+            "cdc_tombstones": {
+                "type": "boolean",
+                "default": False
+            },
+            "shard_count": {
+                "type": "integer",
+                "minimum": 1,
+                "default": 1
+            },
+            "shard_index": {
+                "type": "integer",
+                "minimum": 0,
+                "default": 0
+            },
+            "checkpoint_every": {
+                "type": "integer",
+                "minimum": 1,
+                "default": 500
+            },
+            "checkpoint_interval": {
+                "type": "number",
+                "minimum": 0,
+                "default": 60
+            },
+            "stream_responses": {
+                "type": "boolean",
+                "default": False
+            },
+            "json_backend": {
+                "type": "string",
+                "enum": ["stdlib", "auto", "orjson", "ujson"],
+                "default": "stdlib"
+            },
+            "record_validation": {
+                "type": "string",
+                "enum": ["none", "sample", "all"],
+                "default": "none"
+            },
+            "record_validation_sample_rate": {
+                "type": "number",
+                "exclusiveMinimum": 0,
+                "maximum": 1,
+                "default": 0.01
+            },
+            "request_engine": {
+                "type": "string",
+                "enum": ["threads", "asyncio"],
+                "default": "threads"
+            },
+            "max_concurrency": {
+                "type": "integer",
+                "minimum": 1,
+                "default": 1
+            },
+            "http_pool_maxsize": {
+                "type": "integer",
+                "minimum": 1
+            },
+            "http_keep_alive": {
+                "type": "boolean",
+                "default": True
+            },
+            "max_requests_per_second": {
+                "type": "number",
+                "exclusiveMinimum": 0
+            },
+            "response_cache_path": {
+                "type": "string"
+            },
+            "response_cache_max_bytes": {
+                "type": "integer",
+                "minimum": 0,
+                "default": DEFAULT_MAX_BYTES
+            },
+            "archive_path": {
+                "type": "string"
+            },
+            "archive_mode": {
+                "type": "string",
+                "enum": ["record", "replay"],
+                "default": "record"
+            },
+            "metrics_path": {
+                "type": "string"
+            },
             "_stream": {
                 'type': 'string'
             }
@@ -68,9 +221,122 @@ class TapFPL(Tap):
         "required": ["managers", "gameweeks", "players"]
     }
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the tap and the state shared between its streams."""
+        # Decoded response payloads keyed by API path, see FPLStream.request_payload
+        self.payload_cache: Dict[str, Any] = {}
+        # Request and record timings of every stream, see FPLStream.metrics
+        self.metrics = MetricsRegistry()
+        # Managers resolved from config and leagues, see ManagerStream.get_manager_ids
+        self.manager_ids: Optional[List[int]] = None
+        # HTTP session shared by every stream, see FPLStream.__init__
+        self.requests_session: Optional[requests.Session] = None
+        super().__init__(*args, **kwargs)
+        if self.config.get("shard_index", 0) >= self.config.get("shard_count", 1):
+            raise ConfigValidationError("shard_index must be lower than shard_count.")
+        if self.config.get("stream_responses") and (
+            self.config.get("response_cache_path") or self.config.get("archive_path")
+        ):
+            self.logger.warning(
+                "stream_responses cannot be combined with response_cache_path or "
+                "archive_path, which store whole response bodies. Responses will "
+                "be decoded whole."
+            )
+        # Token bucket shared by every stream, see FPLStream._request
+        self.rate_limiter: Optional[RateLimiter] = None
+        if self.config.get("max_requests_per_second"):
+            self.rate_limiter = RateLimiter(self.config["max_requests_per_second"])
+        # Conditional request cache, see FPLStream._request
+        self.response_cache: Optional[ResponseCache] = None
+        if self.config.get("response_cache_path"):
+            self.response_cache = ResponseCache(
+                self.config["response_cache_path"],
+                self.config.get("response_cache_max_bytes", DEFAULT_MAX_BYTES),
+            )
+        # Raw responses recorded or replayed offline, see FPLStream._request
+        self.response_archive: Optional[ResponseArchive] = None
+        if self.config.get("archive_path"):
+            self.response_archive = ResponseArchive(self.config["archive_path"])
+        # Event loop sending fan-out requests, see FPLStream.request_many
+        self.async_engine: Optional[AsyncRequestEngine] = None
+        if self.config.get("request_engine") == "asyncio":
+            max_concurrency = self.config.get("max_concurrency", 1)
+            try:
+                self.async_engine = AsyncRequestEngine(
+                    self.config.get("http_pool_maxsize", max_concurrency),
+                    DEFAULT_REQUEST_TIMEOUT,
+                )
+            except ImportError:
+                self.logger.warning(
+                    "The asyncio request engine requires aiohttp, which is not "
+                    "installed. Falling back to threads."
+                )
+        # Fast JSON library, see FPLStream.decode_json and _write_record_message
+        self.json_codec: Optional[JSONCodec] = get_codec(
+            self.config.get("json_backend", "stdlib"), self.logger
+        )
+
+    def is_last_synced_stream(self, stream: Stream) -> bool:
+        """Return True if `stream` is the last stream `sync_all` syncs directly."""
+        synced = [
+            name
+            for name, tap_stream in self.streams.items()
+            if (tap_stream.selected or tap_stream.has_selected_descendents)
+            and not tap_stream.parent_stream_type
+        ]
+        return bool(synced) and synced[-1] == stream.name
+
+    def close_resources(self) -> None:
+        """Close the event loop, response archive and response cache of the run."""
+        if self.async_engine:
+            self.async_engine.close()
+            self.async_engine = None
+        if self.response_archive:
+            self.response_archive.close()
+            self.response_archive = None
+        if self.response_cache:
+            self.response_cache.close()
+            self.response_cache = None
+
+    def finish_sync(self) -> None:
+        """Release the run's shared resources and emit its performance metrics.
+
+        Called by the last stream synced by `sync_all`, which the SDK does not
+        allow to be overridden. Each stream's request, parse and record metrics,
+        and the connection reuse of the shared HTTP session, are logged as
+        Singer METRIC messages and written as a JSON summary to `metrics_path`
+        if set. Rate limiter throughput over the whole run is logged once.
+        """
+        self.close_resources()
+        if self.rate_limiter:
+            stats = self.rate_limiter.stats()
+            self.logger.info(
+                f"Rate limiter: {stats['requests']} requests at "
+                f"{stats['effective_rate']:.2f} req/s effective, limit now "
+                f"{stats['current_rate']:.2f} req/s ({stats['throttled']} throttled)"
+            )
+        if isinstance(self.requests_session, requests.Session):
+            self.metrics.observe_connections(*connection_stats(self.requests_session))
+        streams = list(self.streams.values())
+        for stream in streams:
+            for metric in self.metrics.metric_messages(stream.name):
+                stream._write_metric_log(metric, extra_tags=None)
+        if streams:
+            for metric in self.metrics.connection_messages():
+                streams[0]._write_metric_log(metric, extra_tags=None)
+        if self.config.get("metrics_path"):
+            with open(self.config["metrics_path"], "w") as metrics_file:
+                json.dump(self.metrics.summary(), metrics_file, indent=2)
+
     def discover_streams(self) -> List[Stream]:
         """Return a list of discovered streams."""
         if '_stream' in self.config.keys():
-            return [STREAM_TYPES[self.config['_stream']](tap=self)]
+            stream_class: Type[Stream] = STREAM_TYPES[self.config['_stream']]
+            stream_classes = [stream_class]
+            # Child streams are synced by their parent, so it must be discovered too
+            while stream_class.parent_stream_type:
+                stream_class = stream_class.parent_stream_type
+                stream_classes.insert(0, stream_class)
+            return [stream_class(tap=self) for stream_class in stream_classes]
         else:
             return [stream_class(tap=self) for stream_class in STREAM_TYPES.values()]
\ No newline at end of file
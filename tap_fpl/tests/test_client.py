@@ -0,0 +1,502 @@
+import io
+import json
+import random
+import sys
+import time
+import threading
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch, Mock
+from datetime import timedelta
+
+import logging
+import requests
+from pytest import importorskip, raises
+from singer_sdk.helpers._singer import SelectionMask
+from singer_sdk.helpers._typing import conform_record_data_types
+from singer_sdk.exceptions import FatalAPIError, RetriableAPIError
+
+from tap_fpl.tap import TapFPL
+from tap_fpl.client import KeepAliveAdapter, connection_stats
+from tap_fpl.archive import ResponseArchive
+from tap_fpl.cache import ResponseCache
+from tap_fpl.codec import get_codec
+from tap_fpl.conform import InvalidRecordError, RecordConformer
+from tap_fpl.metrics import MetricsRegistry, endpoint_template
+from tap_fpl.jsonstream import iter_array_items, iter_object_members
+from tap_fpl.ratelimit import RateLimiter, parse_retry_after
+
+API = 'https://fantasy.premierleague.com/api'
+
+def make_response(status_code, body=b'', headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = 'OK'
+    response.elapsed = timedelta(seconds=0)
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+class TestFPLStream:
+    def test_point_streams_at_configured_api_url(self):
+        tap = TapFPL(config={'api_url': 'http://127.0.0.1:8000/api'})
+
+        assert 'http://127.0.0.1:8000/api/fixtures' == tap.streams['fixtures'].get_url(None)
+        assert API == TapFPL(config={}).streams['fixtures'].url_base
+
+    def test_share_one_session_between_streams(self):
+        tap = TapFPL(config={'max_concurrency': 16})
+        sessions = {id(stream.requests_session) for stream in tap.streams.values()}
+        adapter = tap.requests_session.get_adapter(API)
+
+        assert {id(tap.requests_session)} == sessions
+        assert isinstance(adapter, KeepAliveAdapter)
+        assert 16 == adapter._pool_maxsize
+
+    def test_close_connections_when_keep_alive_is_off(self):
+        stream = TapFPL(config={'http_keep_alive': False}).streams['events']
+
+        assert 'close' == stream.prepare_path_request(None, '/fixtures').headers['Connection']
+
+    def test_reuse_pooled_connections(self):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header('Content-Length', '2')
+                self.end_headers()
+                self.wfile.write(b'[]')
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            host, port = server.server_address
+            tap = TapFPL(config={'_stream': 'fixtures', 'api_url': f'http://{host}:{port}/api'})
+            for _ in range(3):
+                list(tap.streams['fixtures'].get_records(None))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert (1, 3) == connection_stats(tap.requests_session)
+
+class TestResponseCache:
+    def test_evict_least_recently_used(self, tmp_path):
+        cache = ResponseCache(str(tmp_path / 'cache.db'), max_bytes=10)
+        cache.put('a', '"a"', None, b'aaaa')
+        cache.put('b', '"b"', None, b'bbbb')
+        cache.touch('a')
+        cache.put('c', '"c"', None, b'cccc')
+
+        assert b'aaaa' == cache.get('a').body
+        assert cache.get('b') is None
+        assert b'cccc' == cache.get('c').body
+
+    def test_keep_total_size_across_reopen(self, tmp_path):
+        cache = ResponseCache(str(tmp_path / 'cache.db'), max_bytes=10)
+        cache.put('a', '"a"', None, b'aaaa')
+        cache.put('a', '"a2"', None, b'aa')
+        cache.put('b', '"b"', None, b'bbbb')
+        cache.close()
+
+        reopened = ResponseCache(str(tmp_path / 'cache.db'), max_bytes=9)
+        reopened.put('c', '"c"', None, b'cccc')
+
+        assert reopened.get('a') is None
+        assert b'bbbb' == reopened.get('b').body
+        assert b'cccc' == reopened.get('c').body
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_replay_cached_body_on_not_modified(self, mock_requests, tmp_path):
+        expected = [{'id': 1}]
+        sent_headers = []
+
+        def send(request, timeout, stream=False):
+            sent_headers.append(dict(request.headers))
+            if 'If-None-Match' in request.headers:
+                return make_response(304)
+            return make_response(200, b'{"events": [{"id": 1}]}', {'ETag': '"v1"'})
+
+        mock_session = Mock()
+        mock_session.prepare_request.side_effect = lambda request: request.prepare()
+        mock_session.send.side_effect = send
+        mock_requests.Session.return_value = mock_session
+
+        config = {
+            '_stream': 'events',
+            'response_cache_path': str(tmp_path / 'cache.db')
+        }
+        tap = TapFPL(config=config)
+        first = list(tap.streams['events'].get_records(None))
+        tap.response_cache.close()
+        second = list(TapFPL(config=config).streams['events'].get_records(None))
+
+        assert expected == first == second
+        assert 'If-None-Match' not in sent_headers[0]
+        assert '"v1"' == sent_headers[1]['If-None-Match']
+
+class TestResponseArchive:
+    def test_latest_response_wins(self, tmp_path):
+        archive = ResponseArchive(str(tmp_path / 'responses.gz'))
+        archive.append(f'{API}/fixtures/', 200, {'ETag': '"v1"'}, b'[1]')
+        archive.append(f'{API}/fixtures/', 200, {'ETag': '"v2"'}, b'[1, 2]')
+        archive.close()
+
+        reopened = ResponseArchive(str(tmp_path / 'responses.gz'))
+        archived = reopened.get(f'{API}/fixtures/')
+
+        assert b'[1, 2]' == archived.body
+        assert {'ETag': '"v2"'} == archived.headers
+        assert reopened.get(f'{API}/bootstrap-static/') is None
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_replay_recorded_responses_offline(self, mock_requests, tmp_path):
+        mock_session = Mock()
+        mock_session.prepare_request.side_effect = lambda request: request.prepare()
+        mock_session.send.return_value = make_response(200, b'{"events": [{"id": 1}]}')
+        mock_requests.Session.return_value = mock_session
+        config = {'_stream': 'events', 'archive_path': str(tmp_path / 'responses.gz')}
+
+        recorded = TapFPL(config=config)
+        first = list(recorded.streams['events'].get_records(None))
+        recorded.response_archive.close()
+        mock_session.send.side_effect = requests.exceptions.ConnectionError
+        replayed = TapFPL(config={**config, 'archive_mode': 'replay'})
+        second = list(replayed.streams['events'].get_records(None))
+
+        assert [{'id': 1}] == first == second
+        assert 1 == mock_session.send.call_count
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_fail_to_replay_unrecorded_request(self, mock_requests, tmp_path):
+        mock_session = Mock()
+        mock_session.prepare_request.side_effect = lambda request: request.prepare()
+        mock_requests.Session.return_value = mock_session
+        mock_requests.exceptions.ReadTimeout = requests.exceptions.ReadTimeout
+        config = {
+            '_stream': 'events',
+            'archive_path': str(tmp_path / 'responses.gz'),
+            'archive_mode': 'replay'
+        }
+
+        with raises(FatalAPIError):
+            list(TapFPL(config=config).streams['events'].get_records(None))
+        mock_session.send.assert_not_called()
+
+def byte_chunks(document, size=1):
+    body = json.dumps(document).encode()
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+class TestStreamedDecoding:
+    def test_decode_array_items_split_across_chunks(self):
+        expected = [{'id': 1, 'name': 'Saka ⚽'}, 1234.5, [], None, 'a"]b']
+
+        assert expected == list(iter_array_items(byte_chunks(expected)))
+        assert [] == list(iter_array_items([b' [ ] ']))
+
+    def test_decode_only_requested_object_members(self):
+        document = {
+            'events': [{'id': 1}, {'id': 2}],
+            'game_settings': {'league_join_private_max': 30},
+            'elements': [{'id': 3}],
+            'total_players': 11000000
+        }
+
+        members = dict(iter_object_members(byte_chunks(document, 3), {'elements', 'total_players'}))
+
+        assert {'elements': [{'id': 3}], 'total_players': 11000000} == members
+
+    def test_raise_on_truncated_document(self):
+        with raises(ValueError):
+            list(iter_array_items([b'[{"id": 1}, {"id"']))
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_stream_fixtures_response(self, mock_requests):
+        expected = [{'id': 1, 'event': 1}, {'id': 2, 'event': 1}]
+
+        def send(request, timeout, stream):
+            assert stream is True
+            response = make_response(200)
+            response._content = False
+            response.raw = io.BytesIO(json.dumps(expected).encode())
+            return response
+
+        mock_session = Mock()
+        mock_session.prepare_request.side_effect = lambda request: request.prepare()
+        mock_session.send.side_effect = send
+        mock_requests.Session.return_value = mock_session
+
+        tap = TapFPL(config={'_stream': 'fixtures', 'stream_responses': True})
+        records = list(tap.streams['fixtures'].get_records(None))
+
+        assert expected == records
+
+    def test_stream_only_incrementally_decoded_endpoints(self):
+        stream = TapFPL(config={'stream_responses': True}).streams['fixtures']
+        base = stream.url_base
+
+        assert stream.is_streamed(f'{base}/bootstrap-static/')
+        assert stream.is_streamed(f'{base}/leagues-classic/314/standings?page_standings=2')
+        assert not stream.is_streamed(f'{base}/entry/1/event/7/picks/')
+        assert not stream.is_streamed(f'{base}/element-summary/3/')
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_decode_whole_body_with_response_cache(self, mock_requests, tmp_path, caplog):
+        expected = [{'id': 1}]
+
+        mock_session = Mock()
+        mock_session.prepare_request.side_effect = lambda request: request.prepare()
+        mock_session.send.return_value = make_response(200, json.dumps({'events': expected}).encode())
+        mock_requests.Session.return_value = mock_session
+
+        tap = TapFPL(config={
+            '_stream': 'events',
+            'stream_responses': True,
+            'response_cache_path': str(tmp_path / 'cache.db')
+        })
+        records = list(tap.streams['events'].get_records(None))
+
+        assert expected == records
+        assert mock_session.send.call_args.kwargs['stream'] is False
+        assert 'stream_responses cannot be combined' in caplog.text
+
+def fake_json_module(name):
+    module = types.ModuleType(name)
+    module.loads = json.loads
+    module.dumps = lambda value, ensure_ascii=True: json.dumps(value, ensure_ascii=ensure_ascii)
+    return module
+
+class TestJSONBackend:
+    def test_fall_back_to_stdlib_when_not_installed(self):
+        with patch.dict(sys.modules, {'orjson': None, 'ujson': None}):
+            assert get_codec('auto') is None
+            assert get_codec('orjson') is None
+        assert get_codec('stdlib') is None
+
+    def test_pick_fastest_installed_backend(self):
+        with patch.dict(sys.modules, {'orjson': None, 'ujson': fake_json_module('ujson')}):
+            assert 'ujson' == get_codec('auto').name
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_decode_and_emit_records_with_fast_backend(self, mock_requests, capsys):
+        mock_session = Mock()
+        mock_session.prepare_request.side_effect = lambda request: request.prepare()
+        mock_session.send.return_value = make_response(200, '{"events": [{"id": 1, "name": "Gameweek 1"}]}'.encode())
+        mock_requests.Session.return_value = mock_session
+
+        with patch.dict(sys.modules, {'ujson': fake_json_module('ujson')}):
+            tap = TapFPL(config={'_stream': 'events', 'json_backend': 'ujson'})
+        stream = tap.streams['events']
+        for record in stream.get_records(None):
+            stream._write_record_message(record)
+
+        message = json.loads(capsys.readouterr().out)
+        assert 'ujson' == tap.json_codec.name
+        assert 'RECORD' == message['type']
+        assert {'id': 1, 'name': 'Gameweek 1'} == message['record']
+
+SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'id': {'type': 'integer'},
+        'finished': {'type': ['null', 'boolean']},
+        'name': {'type': ['null', 'string']},
+        'stats': {'type': 'array', 'items': {'type': 'object'}}
+    }
+}
+
+class TestRecordConformer:
+    def test_conform_like_the_sdk(self):
+        logger = logging.getLogger('tap-fpl')
+        record = {'id': 1, 'finished': 1, 'name': 'GW1', 'stats': [{'a': 1}], 'extra': 'x'}
+        conformer = RecordConformer('events', SCHEMA, SelectionMask(), logger)
+
+        assert conform_record_data_types('events', dict(record), SCHEMA, logger) == conformer(dict(record))
+        assert {'id': 1, 'finished': True, 'name': 'GW1', 'stats': [{'a': 1}]} == conformer(dict(record))
+
+    def test_drop_deselected_properties(self):
+        mask = SelectionMask({('properties', 'name'): False})
+        conformer = RecordConformer('events', SCHEMA, mask, logging.getLogger('tap-fpl'))
+
+        assert {'id': 1, 'finished': None} == conformer({'id': 1, 'finished': None, 'name': 'GW1'})
+
+    def test_validate_sample_of_records(self):
+        conformer = RecordConformer(
+            'events', SCHEMA, SelectionMask(), logging.getLogger('tap-fpl'),
+            validation='sample', sample_rate=0.5
+        )
+
+        conformer({'id': '1'})
+        with raises(InvalidRecordError, match="at 'id'"):
+            conformer({'id': '2'})
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_raise_on_invalid_record_when_validating_all(self, mock_requests):
+        mock_session = Mock()
+        mock_session.prepare_request.side_effect = lambda request: request.prepare()
+        mock_session.send.return_value = make_response(200, b'{"events": [{"id": "1"}]}')
+        mock_requests.Session.return_value = mock_session
+
+        tap = TapFPL(config={'_stream': 'events', 'record_validation': 'all'})
+        stream = tap.streams['events']
+
+        with raises(InvalidRecordError):
+            for record in stream.get_records(None):
+                stream._write_record_message(record)
+
+class TestMetrics:
+    def test_template_endpoint_paths(self):
+        assert '/entry/{id}/event/{id}/picks' == endpoint_template('/entry/123/event/7/picks/')
+        assert '/leagues-classic/{id}/standings' == endpoint_template('/leagues-classic/314/standings?page_standings=2')
+        assert '/bootstrap-static' == endpoint_template('/bootstrap-static/')
+
+    def test_bucket_request_latencies(self):
+        metrics = MetricsRegistry()
+        for seconds in (0.01, 0.07, 0.07, 30):
+            metrics.observe_request('selections', '/entry/{id}/event/{id}/picks', seconds, 100)
+
+        summary = metrics.summary()['streams']['selections']['endpoints']['/entry/{id}/event/{id}/picks']
+        assert 4 == summary['requests']
+        assert 400 == summary['bytes']
+        assert 30 == summary['latency']['max']
+        assert {'0.05': 1, '0.1': 2, '+Inf': 1} == {
+            bound: count for bound, count in summary['latency']['buckets'].items() if count
+        }
+
+    @patch('backoff._sync.time.sleep')
+    @patch('singer_sdk.streams.rest.requests')
+    def test_write_summary_after_sync(self, mock_requests, mock_sleep, tmp_path, caplog):
+        body = b'{"events": [{"id": 1}, {"id": 2}]}'
+        mock_session = Mock()
+        mock_session.prepare_request.side_effect = lambda request: request.prepare()
+        mock_session.send.side_effect = [
+            make_response(429, headers={'Retry-After': '0'}),
+            make_response(200, body, {'Content-Length': str(len(body))})
+        ]
+        mock_requests.Session.return_value = mock_session
+        mock_requests.exceptions.ReadTimeout = requests.exceptions.ReadTimeout
+
+        metrics_path = tmp_path / 'metrics.json'
+        tap = TapFPL(config={'_stream': 'events', 'metrics_path': str(metrics_path)})
+        with caplog.at_level(logging.INFO):
+            tap.sync_all()
+
+        summary = json.loads(metrics_path.read_text())['streams']['events']
+        assert 2 == summary['records']
+        assert {'requests': 1, 'retries': 1, 'bytes': len(body), 'parses': 1} == {
+            key: summary['endpoints']['/bootstrap-static'][key]
+            for key in ('requests', 'retries', 'bytes', 'parses')
+        }
+        assert "'metric': 'records_emitted', 'value': 2" in caplog.text
+
+class TestAsyncRequestEngine:
+    def test_fall_back_to_threads_without_aiohttp(self):
+        with patch('tap_fpl.aio.aiohttp', None):
+            tap = TapFPL(config={'request_engine': 'asyncio'})
+
+        assert tap.async_engine is None
+
+    def test_emit_picks_in_order(self):
+        importorskip('aiohttp')
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                manager_id = int(self.path.split('/')[3])
+                time.sleep(random.random() / 100)
+                body = json.dumps({'active_chip': None, 'entry_history': {'points': manager_id}}).encode()
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            host, port = server.server_address
+            tap = TapFPL(config={
+                '_stream': 'selections',
+                'api_url': f'http://{host}:{port}/api',
+                'managers': list(range(1, 41)),
+                'gameweeks': [1, 2],
+                'players': [],
+                'max_concurrency': 8,
+                'request_engine': 'asyncio'
+            })
+            records = list(tap.streams['selections'].get_records(None))
+            tap.async_engine.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert [(manager_id, gameweek) for gameweek in (1, 2) for manager_id in range(1, 41)] == [
+            (record['manager_id'], record['gameweek']) for record in records
+        ]
+        assert [record['manager_id'] for record in records] == [
+            record['entry_history']['points'] for record in records
+        ]
+
+class TestRateLimiter:
+    def test_wait_once_burst_is_spent(self):
+        limiter = RateLimiter(2)
+
+        assert 0 == limiter.reserve()
+        assert 0 == limiter.reserve()
+        assert 0.4 < limiter.reserve() <= 0.5
+
+    def test_back_off_and_recover(self):
+        limiter = RateLimiter(10)
+
+        limiter.throttle(retry_after=30)
+        assert 5 == limiter.rate
+        assert 29 < limiter.reserve() <= 30
+
+        for _ in range(100):
+            limiter.recover()
+        assert 10 == limiter.rate
+        assert 1 == limiter.stats()['throttled']
+
+    def test_parse_retry_after(self):
+        assert 120 == parse_retry_after('120')
+        assert 0 == parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT')
+        assert parse_retry_after(None) is None
+
+    def test_share_limiter_and_retry_on_too_many_requests(self):
+        tap = TapFPL(config={'max_requests_per_second': 4})
+        events, fixtures = tap.streams['events'], tap.streams['fixtures']
+
+        with raises(RetriableAPIError):
+            events.validate_response(make_response(429, headers={'Retry-After': '1'}))
+        fixtures.validate_response(make_response(200))
+
+        assert tap.rate_limiter.stats()['throttled'] == 1
+        assert 2 < tap.rate_limiter.rate < 4
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_log_throughput_once_per_run(self, mock_requests, caplog):
+        def send(request, timeout, stream=False):
+            return make_response(200, b'{"picks": [], "automatic_subs": [], "entry_history": {}}')
+
+        mock_session = Mock()
+        mock_session.prepare_request.side_effect = lambda request: request.prepare()
+        mock_session.send.side_effect = send
+        mock_requests.Session.return_value = mock_session
+
+        tap = TapFPL(config={
+            '_stream': 'selection-picks',
+            'managers': [1, 2, 3],
+            'gameweeks': [1, 2],
+            'max_requests_per_second': 1000
+        })
+        with caplog.at_level(logging.INFO):
+            tap.sync_all()
+
+        assert 1 == sum('Rate limiter' in record.getMessage() for record in caplog.records)
@@ -1,12 +1,17 @@
+import json
 import sqlite3
+import random
+import time
 
-from pytest import fixture, raises
+from pytest import fixture, mark, raises
 from unittest import TestCase
 from unittest.mock import patch, Mock
 from datetime import datetime, timedelta
 from tap_fpl.tap import TapFPL
-from tap_fpl.streams import PlayerDetailsStream
-from singer_sdk.testing import tap_to_target_sync_test
+from tap_fpl.client import record_fingerprint
+from tap_fpl.streams import PlayerDetailsStream, SelectionsStream
+from singer_sdk.exceptions import ConfigValidationError
+from singer_sdk.testing import tap_sync_test, tap_to_target_sync_test
 from target_tester.target import TargetTester
 from copy import deepcopy
 
@@ -24,6 +29,62 @@ def mock_session():
 def target():
     return TargetTester()
 
+API = 'https://fantasy.premierleague.com/api'
+
+def send_by_url(payloads):
+    def send(request, timeout, stream=False):
+        response = Mock()
+        response.elapsed = timedelta(seconds=0)
+        response.status_code = 200
+        response.headers = {}
+        response.json.return_value = deepcopy(payloads[request.url])
+        return response
+    return send
+
+class TestBootstrapStreams:
+    @patch('singer_sdk.streams.rest.requests')
+    def test_share_single_bootstrap_request(self, mock_requests, mock_session):
+        expected = [[{'id': 1}], [{'id': 2}], [{'id': 3}], [{'id': 4}]]
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.send.return_value.json.return_value = {
+            'events': [{'id': 1}],
+            'teams': [{'id': 2}],
+            'elements': [{'id': 3}],
+            'element_types': [{'id': 4}]
+        }
+
+        tap = TapFPL(config={})
+        actual = [
+            list(tap.streams[name].get_records(None))
+            for name in ['events', 'teams', 'elements', 'element-types']
+        ]
+        assert expected == actual
+        assert 1 == mock_session.send.call_count
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_emit_only_changed_records_in_cdc_mode(self, mock_requests, mock_session):
+        mock_requests.Session.return_value = mock_session
+        mock_session.send.return_value.json.return_value = {
+            'elements': [{'id': 1, 'now_cost': 45}, {'id': 2, 'now_cost': 50}, {'id': 3, 'now_cost': 55}]
+        }
+        config = {'_stream': 'elements', 'cdc_mode': True, 'cdc_tombstones': True}
+
+        tap = TapFPL(config=config)
+        first = list(tap.streams['elements'].get_records(None))
+
+        mock_session.send.return_value.json.return_value = {
+            'elements': [{'id': 1, 'now_cost': 45}, {'id': 2, 'now_cost': 51}, {'id': 4, 'now_cost': 40}]
+        }
+        tap = TapFPL(config=config, state=tap.streams['elements'].tap_state)
+        second = list(tap.streams['elements'].get_records(None))
+
+        assert [1, 2, 3] == [row['id'] for row in first]
+        assert [{'id': 2, 'now_cost': 51}, {'id': 4, 'now_cost': 40}] == second[:2]
+        assert 3 == second[2]['id'] and second[2]['_sdc_deleted_at']
+        assert 3 == len(second)
+        assert ['1', '2', '4'] == sorted(tap.streams['elements'].stream_state['record_fingerprints'])
+
 class TestEventsStream:
     @patch('singer_sdk.streams.rest.requests')
     def test_load_finished_game_week_event(self, mock_requests, mock_session, target):
@@ -921,6 +982,7 @@ class TestPlayerDetailsStream:
     def test_load_single_player(self, mock_requests, mock_session, target): 
         expected = [
             {
+                'player_id': 1,
                 'fixtures': [
                     {
                         'id': 1,
@@ -1004,6 +1066,7 @@ class TestPlayerDetailsStream:
         ]
         
         response = deepcopy(expected)[0]
+        del response['player_id']
 
         mock_requests.Session.return_value = mock_session
         mock_session.send.return_value.json.return_value = response
@@ -1021,6 +1084,7 @@ class TestPlayerDetailsStream:
     def test_load_multiple_players(self, mock_requests, mock_session, target):
         expected = [
             {
+                'player_id': 1,
                 'fixtures': [
                     {
                         'id': 1,
@@ -1102,6 +1166,7 @@ class TestPlayerDetailsStream:
                 ]
             },
             {
+                'player_id': 2,
                 'fixtures': [
                     {
                         'id': 2,
@@ -1185,6 +1250,8 @@ class TestPlayerDetailsStream:
         ]
         
         response = deepcopy(expected)
+        for item in response:
+            del item['player_id']
 
         mock_requests.Session.return_value = mock_session
         mock_session.send.return_value.json.side_effect = response
@@ -1224,6 +1291,300 @@ class TestPlayerDetailsStream:
         _, _, target_stdout, _ = tap_to_target_sync_test(tap, target)
         assert expected == len(target_stdout.getvalue().split('\n'))
 
+    @patch('singer_sdk.streams.rest.requests')
+    def test_concurrent_players_are_emitted_in_config_order(self, mock_requests, mock_session):
+        url = 'https://fantasy.premierleague.com/api/element-summary/{}'
+        expected = [
+            {'url': url.format(player_id), 'player_id': player_id}
+            for player_id in [3, 1, 2, 5, 4]
+        ]
+
+        def send(request, timeout, stream=False):
+            time.sleep(random.random() / 100)
+            response = Mock()
+            response.elapsed = timedelta(seconds=0)
+            response.status_code = 200
+            response.json.return_value = {'url': request.url}
+            return response
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send
+
+        tap = TapFPL(config={
+            '_stream': 'player-details',
+            'players': [3, 1, 2, 5, 4],
+            'max_concurrency': 3
+        })
+
+        actual = list(tap.streams['player_details'].get_records(None))
+        assert expected == actual
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_split_players_between_shards(self, mock_requests, mock_session):
+        players = list(range(1, 31))
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/element-summary/{player_id}': {} for player_id in players
+        })
+
+        shards = []
+        for shard_index in range(2):
+            tap = TapFPL(config={
+                '_stream': 'player-details',
+                'players': players,
+                'shard_index': shard_index,
+                'shard_count': 2
+            })
+            shards.append([row['player_id'] for row in tap.streams['player_details'].get_records(None)])
+
+        assert shards[0] and shards[1]
+        assert not set(shards[0]) & set(shards[1])
+        assert players == sorted(shards[0] + shards[1])
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_start_over_when_fewer_keys_than_checkpoint(self, mock_requests, mock_session):
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/element-summary/{player_id}': {} for player_id in [9, 4]
+        })
+
+        tap = TapFPL(
+            config={'_stream': 'player-details', 'players': [9, 4]},
+            state={'bookmarks': {'player_details': {'checkpoint': {'position': 4, 'key': 4}}}}
+        )
+
+        actual = [row['player_id'] for row in tap.streams['player_details'].get_records(None)]
+        assert [9, 4] == actual
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_write_periodic_checkpoints(self, mock_requests, mock_session, capsys):
+        expected = [
+            {'position': 2, 'key': 1},
+            {'position': 4, 'key': 4}
+        ]
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/element-summary/{player_id}': {}
+            for player_id in [3, 1, 2, 4, 5]
+        })
+
+        tap = TapFPL(config={
+            '_stream': 'player-details',
+            'players': [3, 1, 2, 4, 5],
+            'checkpoint_every': 2,
+            'checkpoint_interval': 0
+        })
+        stream = tap.streams['player_details']
+        list(stream.get_records(None))
+
+        states = [
+            json.loads(line)['value'] for line in capsys.readouterr().out.splitlines()
+            if json.loads(line)['type'] == 'STATE'
+        ]
+        assert expected == [state['bookmarks']['player_details']['checkpoint'] for state in states]
+        assert 'checkpoint' not in stream.stream_state
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_limit_checkpoints_by_interval(self, mock_requests, mock_session, capsys):
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/element-summary/{player_id}': {}
+            for player_id in [3, 1, 2]
+        })
+
+        tap = TapFPL(config={
+            '_stream': 'player-details',
+            'players': [3, 1, 2],
+            'checkpoint_every': 1,
+            'checkpoint_interval': 3600
+        })
+        list(tap.streams['player_details'].get_records(None))
+
+        assert not any(
+            json.loads(line)['type'] == 'STATE'
+            for line in capsys.readouterr().out.splitlines()
+        )
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_size_connection_pool_for_concurrency(self, mock_requests, mock_session):
+        expected = 32
+
+        mock_requests.Session.return_value = mock_session
+
+        TapFPL(config={
+            '_stream': 'player-details',
+            'max_concurrency': 32
+        }).discover_streams()
+
+        url, adapter = mock_session.mount.call_args[0]
+        assert 'https://fantasy.premierleague.com/api' == url
+        assert expected == adapter._pool_maxsize
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_discover_players_from_elements(self, mock_requests, mock_session):
+        expected = [
+            {'history': [{'element': 1}], 'player_id': 1},
+            {'history': [{'element': 2}], 'player_id': 2}
+        ]
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/bootstrap-static': {'elements': [{'id': 1}, {'id': 2}]},
+            f'{API}/element-summary/1': {'history': [{'element': 1}]},
+            f'{API}/element-summary/2': {'history': [{'element': 2}]}
+        })
+
+        tap = TapFPL(config={
+            '_stream': 'player-details',
+            'player_mode': 'elements'
+        })
+
+        actual = list(tap.streams['player_details'].get_records(None))
+        assert expected == actual
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_only_fetch_changed_elements(self, mock_requests, mock_session):
+        expected = [{'history': [{'element': 2}], 'player_id': 2}]
+        elements = [
+            {'id': 1, 'event_points': 2, 'transfers_in_event': 10, 'news_added': None},
+            {'id': 2, 'event_points': 6, 'transfers_in_event': 10, 'news_added': None}
+        ]
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/bootstrap-static': {'elements': elements},
+            f'{API}/element-summary/2': {'history': [{'element': 2}]}
+        })
+
+        unchanged = deepcopy(elements[0])
+        changed = dict(elements[1], event_points=2)
+        tap = TapFPL(
+            config={
+                '_stream': 'player-details',
+                'player_mode': 'elements_changed'
+            },
+            state={'bookmarks': {'player_details': {'element_fingerprints': {
+                '1': record_fingerprint(unchanged, PlayerDetailsStream.element_change_keys),
+                '2': record_fingerprint(changed, PlayerDetailsStream.element_change_keys)
+            }}}}
+        )
+        stream = tap.streams['player_details']
+
+        actual = list(stream.get_records(None))
+        assert expected == actual
+        assert record_fingerprint(elements[1], PlayerDetailsStream.element_change_keys) \
+            == stream.stream_state['element_fingerprints']['2']
+
+class TestPlayerSummaryStreams:
+    @mark.parametrize('stream_key,state,expected', [
+        (
+            'player-history',
+            {'replication_key': 'kickoff_time', 'replication_key_value': '2022-01-08T15:00:00Z'},
+            [{'player_id': 1, 'fixture': 2, 'kickoff_time': '2022-01-08T15:00:00Z'}]
+        ),
+        (
+            'player-fixtures',
+            {},
+            [{'player_id': 1, 'id': 3, 'kickoff_time': '2022-01-15T15:00:00Z'}]
+        ),
+        (
+            'player-history-past',
+            {'replication_key': 'season_name', 'replication_key_value': '2020/21'},
+            [{'player_id': 1, 'season_name': '2020/21'}]
+        )
+    ])
+    @patch('singer_sdk.streams.rest.requests')
+    def test_explode_player_payload_without_refetching(self, mock_requests, stream_key, state, expected, mock_session):
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/element-summary/1': {
+                'history': [
+                    {'fixture': 1, 'kickoff_time': '2022-01-01T15:00:00Z'},
+                    {'fixture': 2, 'kickoff_time': '2022-01-08T15:00:00Z'}
+                ],
+                'fixtures': [{'id': 3, 'kickoff_time': '2022-01-15T15:00:00Z'}],
+                'history_past': [{'season_name': '2019/20'}, {'season_name': '2020/21'}]
+            }
+        })
+
+        name = stream_key.replace('-', '_')
+        tap = TapFPL(
+            config={
+                '_stream': stream_key,
+                'players': [1]
+            },
+            state={'bookmarks': {name: {'partitions': [
+                dict(state, context={'player_id': 1})
+            ]}}}
+        )
+
+        tap_stdout, _ = tap_sync_test(tap)
+        messages = [json.loads(line) for line in tap_stdout.getvalue().splitlines()]
+        actual = [
+            message['record'] for message in messages
+            if message['type'] == 'RECORD' and message['stream'] == name
+        ]
+        assert expected == actual
+        assert 1 == mock_session.send.call_count
+        assert {} == tap.payload_cache
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_keep_player_fixtures_state_unpartitioned(self, mock_requests, mock_session):
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/element-summary/{player_id}': {
+                'history': [], 'fixtures': [{'id': 3}], 'history_past': []
+            }
+            for player_id in [1, 2]
+        })
+
+        tap = TapFPL(config={'_stream': 'player-fixtures', 'players': [1, 2]})
+        tap_sync_test(tap)
+
+        assert 'partitions' not in tap.streams['player_fixtures'].stream_state
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_reemit_history_row_updated_after_first_emit(self, mock_requests, mock_session):
+        corrected = {'fixture': 2, 'kickoff_time': '2022-01-08T15:00:00Z', 'bonus': 3, 'total_points': 9}
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/element-summary/1': {
+                'history': [{'fixture': 1, 'kickoff_time': '2022-01-01T15:00:00Z'}, corrected],
+                'fixtures': [],
+                'history_past': []
+            }
+        })
+
+        tap = TapFPL(
+            config={'_stream': 'player-history', 'players': [1]},
+            state={'bookmarks': {'player_history': {'partitions': [{
+                'context': {'player_id': 1},
+                'replication_key': 'kickoff_time',
+                'replication_key_value': '2022-01-08T15:00:00Z'
+            }]}}}
+        )
+
+        tap_stdout, _ = tap_sync_test(tap)
+        messages = [json.loads(line) for line in tap_stdout.getvalue().splitlines()]
+        actual = [
+            message['record'] for message in messages
+            if message['type'] == 'RECORD' and message['stream'] == 'player_history'
+        ]
+        assert [{'player_id': 1, **corrected}] == actual
+
 class TestStandingsStream:
     def test_raise_error_with_no_league_id_config(self, target):
         tap = TapFPL(config={
@@ -1236,6 +1597,19 @@ class TestStandingsStream:
     @patch('singer_sdk.streams.rest.requests')
     def test_load_standings(self, mock_requests, mock_session, target):
         expected = [{
+            'id': 1,
+            'event_total': 1,
+            'player_name': 'John Doe',
+            'rank': 1,
+            'last_rank': 1,
+            'rank_sort': 1,
+            'total': 1,
+            'entry': 1,
+            'entry_name': 'Team Name',
+            'league_id': 1,
+            'last_updated_data': '2022-01-01T00:00:00Z'
+        }]
+        response = {
             'last_updated_data': '2022-01-01T00:00:00Z',
             'league': {
                 'id': 1,
@@ -1253,6 +1627,8 @@ class TestStandingsStream:
                 'rank': None
             },
             'standings': {
+                'has_next': False,
+                'page': 1,
                 'results': [
                     {
                         'id': 1,
@@ -1267,10 +1643,10 @@ class TestStandingsStream:
                     }
                 ]
             }
-        }]
+        }
 
         mock_requests.Session.return_value = mock_session
-        mock_session.send.return_value.json.return_value = deepcopy(expected[0])
+        mock_session.send.return_value.json.return_value = response
 
         tap = TapFPL(config={
             '_stream': 'standings',
@@ -1281,6 +1657,43 @@ class TestStandingsStream:
         actual = eval(target_stdout.getvalue().split('\n')[0])
         assert expected == actual
 
+    @patch('singer_sdk.streams.rest.requests')
+    def test_follow_pages_across_leagues(self, mock_requests, mock_session):
+        expected = [(1, 11), (1, 12), (1, 13), (2, 21)]
+        pages = {
+            (1, 1): {'has_next': True, 'results': [{'entry': 11}, {'entry': 12}]},
+            (1, 2): {'has_next': False, 'results': [{'entry': 13}]},
+            (2, 1): {'has_next': False, 'results': [{'entry': 21}]}
+        }
+
+        def send(request, timeout, stream=False):
+            league_id = int(request.url.split('/')[-2])
+            response = Mock()
+            response.elapsed = timedelta(seconds=0)
+            response.status_code = 200
+            response.json.return_value = {
+                'last_updated_data': '2022-01-01T00:00:00Z',
+                'standings': deepcopy(pages[(league_id, request.params['page_standings'])])
+            }
+            return response
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send
+
+        tap = TapFPL(config={
+            '_stream': 'standings',
+            'league_ids': [1, 2]
+        })
+        stream = tap.streams['standings']
+
+        actual = [
+            (row['league_id'], row['entry'])
+            for context in stream.partitions
+            for row in stream.get_records(context)
+        ]
+        assert expected == actual
+
     @patch('singer_sdk.streams.rest.requests')
     def test_raise_error_on_inaccurate_schema(self, mock_requests, mock_session, target):
         expected = {'last_updated_data': 1}
@@ -1297,6 +1710,65 @@ class TestStandingsStream:
         with raises(Exception):
             tap_to_target_sync_test(tap, target)
 
+class TestLiveElementStatsStream:
+    @patch('singer_sdk.streams.rest.requests')
+    def test_emit_only_changed_elements(self, mock_requests, mock_session):
+        explain = [{'fixture': 1, 'stats': [{'identifier': 'minutes', 'points': 2, 'value': 90}]}]
+        live = {
+            'elements': [
+                {'id': 1, 'stats': {'minutes': 90, 'total_points': 2}, 'explain': explain},
+                {'id': 2, 'stats': {'minutes': 0, 'total_points': 0}, 'explain': []}
+            ]
+        }
+        payloads = {f'{API}/event/7/live': live}
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url(payloads)
+        config = {'_stream': 'live-element-stats', 'gameweeks': [7]}
+
+        tap = TapFPL(config=config)
+        stream = tap.streams['live_element_stats']
+        first = list(stream.get_records({'gameweek': 7}))
+
+        payloads[f'{API}/event/7/live'] = deepcopy(live)
+        payloads[f'{API}/event/7/live']['elements'][1]['stats']['minutes'] = 15
+        tap = TapFPL(config=config, state=stream.tap_state)
+        second = list(tap.streams['live_element_stats'].get_records({'gameweek': 7}))
+
+        assert [
+            {'gameweek': 7, 'id': 1, 'minutes': 90, 'total_points': 2, 'explain': explain},
+            {'gameweek': 7, 'id': 2, 'minutes': 0, 'total_points': 0, 'explain': []}
+        ] == first
+        assert [{'gameweek': 7, 'id': 2, 'minutes': 15, 'total_points': 0, 'explain': []}] == second
+        assert 2 == mock_session.send.call_count
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_poll_only_unfinished_gameweeks(self, mock_requests, mock_session):
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/bootstrap-static': {'events': [
+                {'id': 5, 'finished': True, 'data_checked': True, 'is_current': False},
+                {'id': 6, 'finished': True, 'data_checked': False, 'is_current': False},
+                {'id': 7, 'finished': False, 'data_checked': False, 'is_current': True}
+            ]}
+        })
+
+        tap = TapFPL(
+            config={'_stream': 'live-element-stats', 'gameweeks': [5, 6, 7]},
+            state={'bookmarks': {'live_element_stats': {'partitions': [
+                {'context': {'gameweek': 5}, 'element_fingerprints': {'1': 'a'}},
+                {'context': {'gameweek': 6}, 'element_fingerprints': {'1': 'b'}}
+            ]}}}
+        )
+        stream = tap.streams['live_element_stats']
+
+        assert [{'gameweek': 6}, {'gameweek': 7}] == stream.partitions
+        assert [
+            {'context': {'gameweek': 6}, 'element_fingerprints': {'1': 'b'}}
+        ] == stream.stream_state['partitions']
+
 class TestSelectionsStream:
     def test_get_url_with_manager_id_and_gameweek(self):
         expected = 'https://fantasy.premierleague.com/api/entry/1/event/1/picks'
@@ -1587,4 +2059,444 @@ class TestSelectionsStream:
 
     
 
+    @patch('singer_sdk.streams.rest.requests')
+    def test_concurrent_picks_are_emitted_in_config_order(self, mock_requests, mock_session):
+        url = 'https://fantasy.premierleague.com/api/entry/{}/event/{}/picks'
+        expected = [
+            {'manager_id': manager_id, 'gameweek': gameweek, 'active_chip': url.format(manager_id, gameweek)}
+            for gameweek in [1, 2]
+            for manager_id in [1, 2, 3]
+        ]
+
+        def send(request, timeout, stream=False):
+            time.sleep(random.random() / 100)
+            response = Mock()
+            response.elapsed = timedelta(seconds=0)
+            response.status_code = 200
+            response.json.return_value = {'active_chip': request.url}
+            return response
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send
+
+        tap = TapFPL(config={
+            '_stream': 'selections',
+            'managers': [1, 2, 3],
+            'gameweeks': [1, 2],
+            'max_concurrency': 4
+        })
+
+        actual = list(tap.streams['selections'].get_records(None))
+        assert expected == actual
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_skip_finished_gameweeks_already_in_state(self, mock_requests, mock_session):
+        expected = [(2, 1), (1, 2), (2, 2)]
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/bootstrap-static': {'events': [
+                {'id': 1, 'finished': True, 'data_checked': True},
+                {'id': 2, 'finished': False, 'data_checked': False}
+            ]},
+            f'{API}/entry/1/event/2/picks': {},
+            f'{API}/entry/2/event/1/picks': {},
+            f'{API}/entry/2/event/2/picks': {}
+        })
+
+        tap = TapFPL(
+            config={
+                '_stream': 'selections',
+                'managers': [1, 2],
+                'gameweeks': [1, 2],
+                'skip_finished_gameweeks': True
+            },
+            state={'bookmarks': {'selections': {'partitions': [
+                {'context': {'manager_id': 1}, 'synced_through_gameweek': 1}
+            ]}}}
+        )
+        stream = tap.streams['selections']
+
+        actual = [(row['manager_id'], row['gameweek']) for row in stream.get_records(None)]
+        assert expected == actual
+        assert [
+            {'context': {'manager_id': 1}, 'synced_through_gameweek': 1},
+            {'context': {'manager_id': 2}, 'synced_through_gameweek': 1}
+        ] == stream.stream_state['partitions']
+
+    def test_compact_finished_gameweeks_from_older_state(self):
+        manager_state = {'context': {'manager_id': 1}, 'finished_gameweeks': [3, 1, 2, 5]}
+
+        SelectionsStream.compact_synced_gameweeks(manager_state)
+
+        assert {'context': {'manager_id': 1}, 'synced_through_gameweek': 3} == manager_state
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_resolve_current_gameweek_from_events(self, mock_requests, mock_session):
+        expected = [(1, 2)]
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/bootstrap-static': {'events': [
+                {'id': 1, 'finished': True, 'data_checked': True, 'is_current': False},
+                {'id': 2, 'finished': False, 'data_checked': False, 'is_current': True},
+                {'id': 3, 'finished': False, 'data_checked': False, 'is_current': False}
+            ]},
+            f'{API}/entry/1/event/2/picks': {}
+        })
+
+        tap = TapFPL(config={
+            '_stream': 'selections',
+            'managers': [1],
+            'gameweek_mode': 'current'
+        })
+
+        actual = [(row['manager_id'], row['gameweek']) for row in tap.streams['selections'].get_records(None)]
+        assert expected == actual
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_resolve_gameweeks_since_state(self, mock_requests, mock_session):
+        expected = [(1, 2), (1, 3)]
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/bootstrap-static': {'events': [
+                {'id': 1, 'finished': True, 'data_checked': True, 'is_current': False},
+                {'id': 2, 'finished': True, 'data_checked': True, 'is_current': False},
+                {'id': 3, 'finished': False, 'data_checked': False, 'is_current': True},
+                {'id': 4, 'finished': False, 'data_checked': False, 'is_current': False}
+            ]},
+            f'{API}/entry/1/event/2/picks': {},
+            f'{API}/entry/1/event/3/picks': {}
+        })
+
+        tap = TapFPL(
+            config={
+                '_stream': 'selections',
+                'managers': [1],
+                'gameweek_mode': 'since_state'
+            },
+            state={'bookmarks': {'selections': {'synced_through_gameweek': 1}}}
+        )
+        stream = tap.streams['selections']
+
+        actual = [(row['manager_id'], row['gameweek']) for row in stream.get_records(None)]
+        assert expected == actual
+        assert 2 == stream.stream_state['synced_through_gameweek']
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_resume_from_checkpoint(self, mock_requests, mock_session):
+        expected = [(3, 1), (1, 2), (2, 2), (3, 2)]
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/entry/{manager_id}/event/{gameweek}/picks': {}
+            for manager_id, gameweek in expected
+        })
+
+        tap = TapFPL(
+            config={'_stream': 'selections', 'managers': [1, 2, 3], 'gameweeks': [1, 2]},
+            state={'bookmarks': {'selections': {'checkpoint': {'position': 2, 'key': [2, 1]}}}}
+        )
+        stream = tap.streams['selections']
+
+        actual = [(row['manager_id'], row['gameweek']) for row in stream.get_records(None)]
+        assert expected == actual
+        assert 'checkpoint' not in stream.stream_state
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_start_over_on_mismatched_checkpoint(self, mock_requests, mock_session):
+        expected = [(1, 1), (2, 1)]
 
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/entry/{manager_id}/event/{gameweek}/picks': {}
+            for manager_id, gameweek in expected
+        })
+
+        tap = TapFPL(
+            config={'_stream': 'selections', 'managers': [1, 2], 'gameweeks': [1]},
+            state={'bookmarks': {'selections': {'checkpoint': {'position': 1, 'key': [9, 1]}}}}
+        )
+
+        actual = [(row['manager_id'], row['gameweek']) for row in tap.streams['selections'].get_records(None)]
+        assert expected == actual
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_write_child_schema_and_state_once(self, mock_requests, mock_session):
+        managers = list(range(1, 31))
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/entry/{manager_id}/event/{gameweek}/picks': {
+                'picks': [{'element': 1, 'position': 1}],
+                'automatic_subs': [],
+                'entry_history': {'event': gameweek, 'points': 50}
+            }
+            for manager_id in managers
+            for gameweek in [1, 2]
+        })
+
+        tap = TapFPL(config={'_stream': 'selection-picks', 'managers': managers, 'gameweeks': [1, 2]})
+        tap_stdout, _ = tap_sync_test(tap)
+        messages = [json.loads(line) for line in tap_stdout.getvalue().splitlines()]
+
+        schemas = [message['stream'] for message in messages if message['type'] == 'SCHEMA']
+        states = [message for message in messages if message['type'] == 'STATE']
+        records = [message for message in messages if message['type'] == 'RECORD']
+        assert sorted(schemas) == sorted(set(schemas))
+        assert len(states) <= 3
+        assert 60 == sum(message['stream'] == 'selection_picks' for message in records)
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_split_managers_between_shards(self, mock_requests, mock_session):
+        managers = list(range(1, 21))
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/entry/{manager_id}/event/{gameweek}/picks': {}
+            for manager_id in managers
+            for gameweek in [1, 2]
+        })
+
+        shards = []
+        for shard_index in range(3):
+            tap = TapFPL(config={
+                '_stream': 'selections',
+                'managers': managers,
+                'gameweeks': [1, 2],
+                'shard_index': shard_index,
+                'shard_count': 3
+            })
+            rows = list(tap.streams['selections'].get_records(None))
+            shards.append({(row['manager_id'], row['gameweek']) for row in rows})
+            # Every gameweek of a manager is synced by the same shard
+            assert {manager_id for manager_id, gameweek in shards[-1] if gameweek == 1} == \
+                {manager_id for manager_id, gameweek in shards[-1] if gameweek == 2}
+
+        assert 40 == sum(len(shard) for shard in shards)
+        assert {(manager_id, gameweek) for manager_id in managers for gameweek in [1, 2]} == set().union(*shards)
+
+    def test_raise_error_on_shard_index_out_of_range(self):
+        with raises(ConfigValidationError):
+            TapFPL(config={
+                '_stream': 'selections',
+                'managers': [1],
+                'gameweeks': [1],
+                'shard_index': 2,
+                'shard_count': 2
+            })
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_seed_managers_lazily_from_league_standings(self, mock_requests, mock_session):
+        expected = [
+            'entry/2/event/1/picks',
+            'leagues-classic/10/standings?page_standings=1',
+            'entry/1/event/1/picks',
+            'leagues-classic/10/standings?page_standings=2',
+            'entry/3/event/1/picks',
+            'entry/2/event/2/picks',
+            'entry/1/event/2/picks',
+            'entry/3/event/2/picks'
+        ]
+        pages = {
+            1: {'has_next': True, 'results': [{'entry': 1}, {'entry': 2}]},
+            2: {'has_next': False, 'results': [{'entry': 3}]}
+        }
+        requested = []
+
+        def send(request, timeout, stream=False):
+            response = Mock()
+            response.elapsed = timedelta(seconds=0)
+            response.status_code = 200
+            path = request.url[len(API) + 1:]
+            if 'standings' in path:
+                page = request.params['page_standings']
+                path += f'?page_standings={page}'
+                response.json.return_value = {
+                    'last_updated_data': '2022-01-01T00:00:00Z',
+                    'standings': deepcopy(pages[page])
+                }
+            else:
+                response.json.return_value = {}
+            requested.append(path)
+            return response
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send
+
+        tap = TapFPL(config={
+            '_stream': 'selections',
+            'managers': [2],
+            'manager_league_ids': [10],
+            'gameweeks': [1, 2]
+        })
+
+        list(tap.streams['selections'].get_records(None))
+        assert expected == requested
+
+    @mark.parametrize('stream_key,expected', [
+        (
+            'selection-picks',
+            [
+                {'manager_id': 1, 'gameweek': 2, 'element': 10, 'position': 1},
+                {'manager_id': 1, 'gameweek': 2, 'element': 11, 'position': 2}
+            ]
+        ),
+        (
+            'selection-auto-subs',
+            [{'manager_id': 1, 'gameweek': 2, 'element_in': 12, 'element_out': 11}]
+        ),
+        (
+            'selection-entry-history',
+            [{'manager_id': 1, 'gameweek': 2, 'points': 50}]
+        )
+    ])
+    @patch('singer_sdk.streams.rest.requests')
+    def test_explode_picks_payload_without_refetching(self, mock_requests, stream_key, expected, mock_session):
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/entry/1/event/2/picks': {
+                'picks': [{'element': 10, 'position': 1}, {'element': 11, 'position': 2}],
+                'automatic_subs': [{'element_in': 12, 'element_out': 11}],
+                'entry_history': {'points': 50}
+            }
+        })
+
+        name = stream_key.replace('-', '_')
+        tap = TapFPL(config={
+            '_stream': stream_key,
+            'managers': [1],
+            'gameweeks': [2]
+        })
+
+        tap_stdout, _ = tap_sync_test(tap)
+        messages = [json.loads(line) for line in tap_stdout.getvalue().splitlines()]
+        actual = [
+            message['record'] for message in messages
+            if message['type'] == 'RECORD' and message['stream'] == name
+        ]
+        assert expected == actual
+        assert 1 == mock_session.send.call_count
+        assert {} == tap.payload_cache
+        assert 'partitions' not in tap.state['bookmarks'][name]
+
+class TestManagerStreams:
+    @patch('singer_sdk.streams.rest.requests')
+    def test_emit_history_from_bookmarked_event(self, mock_requests, mock_session):
+        history = {
+            'current': [{'event': event, 'points': event * 10} for event in [1, 2, 3]],
+            'past': [],
+            'chips': []
+        }
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({
+            f'{API}/entry/{manager_id}/history': history for manager_id in [1, 2]
+        })
+
+        tap = TapFPL(
+            config={'_stream': 'manager-history', 'managers': [1, 2], 'max_concurrency': 2},
+            state={'bookmarks': {'manager_history': {'partitions': [
+                {'context': {'manager_id': 2}, 'replication_key': 'event', 'replication_key_value': 2}
+            ]}}}
+        )
+        stream = tap.streams['manager_history']
+
+        actual = [(row['manager_id'], row['event']) for row in stream.get_records(None)]
+        assert [(1, 1), (1, 2), (1, 3), (2, 2), (2, 3)] == actual
+        assert {1: 3, 2: 3} == {
+            manager_id: partition['replication_key_value']
+            for manager_id, partition in stream.get_manager_states().items()
+        }
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_emit_transfers_from_bookmarked_time(self, mock_requests, mock_session):
+        transfers = [
+            {'element_in': 3, 'element_out': 4, 'event': 2, 'time': '2022-08-12T10:00:00.000000Z'},
+            {'element_in': 1, 'element_out': 2, 'event': 1, 'time': '2022-08-05T10:00:00.000000Z'}
+        ]
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({f'{API}/entry/1/transfers': transfers})
+
+        tap = TapFPL(
+            config={'_stream': 'manager-transfers', 'managers': [1]},
+            state={'bookmarks': {'manager_transfers': {'partitions': [
+                {'context': {'manager_id': 1}, 'replication_key': 'time',
+                 'replication_key_value': '2022-08-10T00:00:00.000000Z'}
+            ]}}}
+        )
+        stream = tap.streams['manager_transfers']
+
+        actual = list(stream.get_records(None))
+        assert [{**transfers[0], 'manager_id': 1}] == actual
+        assert '2022-08-12T10:00:00.000000Z' == stream.get_manager_states()[1]['replication_key_value']
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_emit_no_transfers_on_second_run(self, mock_requests, mock_session):
+        transfers = [
+            {'element_in': 3, 'element_out': 4, 'event': 2, 'time': '2022-08-12T10:00:00.000000Z'},
+            {'element_in': 1, 'element_out': 2, 'event': 1, 'time': '2022-08-05T10:00:00.000000Z'}
+        ]
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send_by_url({f'{API}/entry/1/transfers': transfers})
+
+        first = TapFPL(config={'_stream': 'manager-transfers', 'managers': [1]})
+        assert 2 == len(list(first.streams['manager_transfers'].get_records(None)))
+
+        second = TapFPL(
+            config={'_stream': 'manager-transfers', 'managers': [1]},
+            state=first.state
+        )
+        assert [] == list(second.streams['manager_transfers'].get_records(None))
+
+    @patch('singer_sdk.streams.rest.requests')
+    def test_share_manager_list_between_streams(self, mock_requests, mock_session):
+        requested = []
+
+        def send(request, timeout, stream=False):
+            requested.append(request.url[len(API) + 1:])
+            response = Mock()
+            response.elapsed = timedelta(seconds=0)
+            response.status_code = 200
+            if 'standings' in request.url:
+                response.json.return_value = {
+                    'last_updated_data': '2022-01-01T00:00:00Z',
+                    'standings': {'has_next': False, 'results': [{'entry': 1}, {'entry': 2}]}
+                }
+            elif request.url.endswith('history'):
+                response.json.return_value = {'current': []}
+            else:
+                response.json.return_value = []
+            return response
+
+        mock_requests.Session.return_value = mock_session
+        mock_session.prepare_request.side_effect = lambda request: request
+        mock_session.send.side_effect = send
+
+        tap = TapFPL(config={'managers': [], 'manager_league_ids': [10]})
+        list(tap.streams['manager_history'].get_records(None))
+        list(tap.streams['manager_transfers'].get_records(None))
+
+        assert [
+            'leagues-classic/10/standings',
+            'entry/1/history',
+            'entry/2/history',
+            'entry/1/transfers',
+            'entry/2/transfers'
+        ] == requested